@@ -112,7 +112,7 @@ https://github.com/amlaksil/mpesa-sdk
 
 __version__ = "1.0.0"
 
-from .auth.auth import Auth
+from .auth.auth import Auth, get_access_token
 from .config import Config
 from .payments.stk_push import STKPush
 from .payments.c2b import C2B
@@ -120,6 +120,9 @@ from .payments.b2c import B2C
 from .utils.exceptions import (
         APIError, AuthenticationError,
         TimeoutError, NetworkError, HTTPError,
-        TooManyRedirects, ValidationError
+        TooManyRedirects, ValidationError,
+        InvalidClientIDError, InvalidAuthenticationError,
+        InvalidAuthorizationHeaderError, InvalidGrantTypeError,
+        CircuitOpenError
         )
 from .utils.logger import get_logger
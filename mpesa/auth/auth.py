@@ -6,22 +6,41 @@ This module handles the authentication process required to interact with
 the M-Pesa API. It is responsible for obtaining an access token that is
 required for authenticating subsequent API requests.
 """
-import logging
-import base64
-from typing import Dict, Any
+import asyncio
+import threading
+import time
+import weakref
+from typing import Dict, Any, Optional, Tuple, Union, TYPE_CHECKING
+from pydantic import ValidationError as ValError
 from mpesa.config import Config
 from mpesa.utils.logger import get_logger
 from mpesa.auth.models import ConfigModel, TokenResponseModel
-from mpesa.utils.client import APIClient
+from mpesa.utils.client import (
+        APIClient, close_default_async_client, get_default_async_client,
+        get_default_client
+        )
 from mpesa.utils.exceptions import (
         APIError, AuthenticationError,
         TimeoutError, NetworkError, HTTPError,
         TooManyRedirects, ValidationError
         )
-from mpesa.utils.error_handler import handle_error
+
+if TYPE_CHECKING:
+    from mpesa.utils.async_client import AsyncAPIClient
+
+try:
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
 
 logger = get_logger(__name__)
 
+# Refresh cached tokens this many seconds before they actually expire.
+TOKEN_EXPIRY_MARGIN = 30
+
+_default_auths: Dict[Tuple[str, str, str], "Auth"] = {}
+_default_auths_lock = threading.Lock()
+
 
 class Auth:
     """
@@ -30,15 +49,37 @@ class Auth:
     Attributes:
         config (ConfigModel): Validated configuration for the API client.
         client (APIClient): Client for communicating with the API.
+
+    Tokens returned by `get_token` are cached until shortly before they
+    expire, so repeated calls do not hit the API. Threads that find the
+    cache empty wait for a single fetch instead of each sending one, and
+    so do tasks calling `get_token_async` on the same event loop.
     """
-    def __init__(self, base_url: str, client_key: str, client_secret: str):
+    __slots__ = (
+        "config", "client", "async_client", "_headers", "_params",
+        "_endpoint", "_cached_token", "_token_expires_at", "_lock",
+        "_async_locks")
+
+    def __init__(
+            self, base_url: str, client_key: str, client_secret: str,
+            client: APIClient = None,
+            async_client: "AsyncAPIClient" = None):
         """
         Initializes the Auth class with API configuration.
 
+        The token request (endpoint, headers, and query parameters) is
+        built here once, so `Config.TOKEN_GENERATE_ENDPOINT` must be set
+        before the instance is created.
+
         Args:
             base_url (str): The base URL of the M-Pesa API.
             client_key (str): The client key for authentication.
             client_secret (str): The client secret for authentication.
+            client (APIClient, optional): A custom HTTP client.
+        Defaults to the shared `APIClient` for `base_url`.
+            async_client (AsyncAPIClient, optional): Client used by
+        `get_token_async`. Defaults to the shared `AsyncAPIClient` for
+        `base_url` on the running event loop.
 
         Raises:
             ValidationError: If the configuration parameters are invalid.
@@ -49,14 +90,31 @@ class Auth:
                     client_key=client_key,
                     client_secret=client_secret
                     )
-        except ValidationError as e:
-            handle_error(ValidationError(e), __name__)
-        self.client = APIClient(base_url=self.config.base_url)
+        except ValError as e:
+            logger.error("Configuration validation failed: %s", e)
+            raise
+        self.client = client or get_default_client(self.config.base_url)
+        self.async_client = async_client
+        credentials = b64encode(
+            f"{self.config.client_key}:{self.config.client_secret}".encode())
+        self._headers = {
+            "Authorization": (b"Basic " + credentials).decode("ascii")}
+        self._params = {"grant_type": "client_credentials"}
+        self._endpoint = Config.TOKEN_GENERATE_ENDPOINT
+        self._cached_token = None
+        self._token_expires_at = 0.0
+        self._lock = threading.Lock()
+        # asyncio locks are bound to one event loop, so keep one per loop.
+        self._async_locks = weakref.WeakKeyDictionary()
 
     def get_token(self) -> Dict[str, Any]:
         """
         Fetches an access token from the M-Pesa API.
 
+        A previously fetched token is reused until it is within
+        `TOKEN_EXPIRY_MARGIN` seconds of expiring. Only one thread at a
+        time fetches a new token; the others reuse the token it stores.
+
         Returns:
             Dict[str, Any]: A dictionary with the access token, token type,
             and expiration details (expires_in and valid_for).
@@ -67,34 +125,156 @@ class Auth:
             APIError: If the API request fails.
             Exception: If an unexpected error occurs.
         """
-        auth_string = f"{self.config.client_key}:{self.config.client_secret}"
-        encoded_credentials = base64.b64encode(auth_string.encode()).decode()
-        headers = {"Authorization": f"Basic {encoded_credentials}"}
-        params = {"grant_type": "client_credentials"}
-        endpoint = Config.TOKEN_GENERATE_ENDPOINT
+        cached_token = self._get_cached_token(time.monotonic())
+        if cached_token is not None:
+            return cached_token
 
-        try:
-            token_response = self.client.get(
-                    endpoint,
-                    headers=headers,
-                    params=params
-                    )
-            validated_response = TokenResponseModel(**token_response)
-            logger.info("Access token successfully retrieved.")
-
-            valid_for = self.convert_expiry_time(
-                validated_response.expires_in)
-
-            return {
-                    "access_token": validated_response.access_token,
-                    "token_type": validated_response.token_type,
-                    "expires_in": validated_response.expires_in,
-                    "valid_for": valid_for
-                }
-        except (APIError, AuthenticationError,
-                TimeoutError, NetworkError, HTTPError,
-                TooManyRedirects, ValidationError) as e:
-            self.client.handle_exception(type(e), e, __name__)
+        with self._lock:
+            # Another thread may have stored a token while this one waited.
+            now = time.monotonic()
+            cached_token = self._get_cached_token(now)
+            if cached_token is not None:
+                return cached_token
+
+            try:
+                token_response = self.client.get(
+                        self._endpoint,
+                        headers=self._headers,
+                        params=self._params,
+                        response_model=TokenResponseModel
+                        )
+                return self._store_token(token_response, now)
+            except (APIError, AuthenticationError,
+                    TimeoutError, NetworkError, HTTPError,
+                    TooManyRedirects, ValidationError) as e:
+                self.client.handle_exception(type(e), e, __name__)
+
+    async def get_token_async(self) -> Dict[str, Any]:
+        """
+        Asynchronous variant of `get_token`.
+
+        The token cache is shared with `get_token`, so a token fetched by
+        either method is reused by both. Only one task per event loop
+        fetches a new token; the others wait for it and reuse it.
+
+        Returns:
+            Dict[str, Any]: A dictionary with the access token, token type,
+            and expiration details (expires_in and valid_for).
+
+        Raises:
+            ValidationError: If the API response does not
+            match the expected schema.
+            APIError: If the API request fails.
+        """
+        cached_token = self._get_cached_token(time.monotonic())
+        if cached_token is not None:
+            return cached_token
+
+        loop = asyncio.get_running_loop()
+        lock = self._async_locks.get(loop)
+        if lock is None:
+            lock = self._async_locks[loop] = asyncio.Lock()
+        async with lock:
+            # Another task may have stored a token while this one waited.
+            now = time.monotonic()
+            cached_token = self._get_cached_token(now)
+            if cached_token is not None:
+                return cached_token
+
+            client = self.async_client or get_default_async_client(
+                self.config.base_url)
+            try:
+                token_response = await client.get(
+                        self._endpoint,
+                        headers=self._headers,
+                        params=self._params,
+                        response_model=TokenResponseModel
+                        )
+                return self._store_token(token_response, now)
+            except (APIError, AuthenticationError,
+                    TimeoutError, NetworkError, HTTPError,
+                    TooManyRedirects, ValidationError) as e:
+                client.handle_exception(type(e), e, __name__)
+
+    def _get_cached_token(self, now: float) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cached token unless it is about to expire.
+
+        Args:
+            now (float): The current `time.monotonic()` value.
+
+        Returns:
+            Optional[Dict[str, Any]]: The token response, or None if a new
+            token must be fetched.
+        """
+        if now < self._token_expires_at - TOKEN_EXPIRY_MARGIN:
+            return self._build_token_response(
+                self._cached_token, int(self._token_expires_at - now))
+        return None
+
+    def _store_token(
+            self, token_response: Union[TokenResponseModel, Dict[str, Any]],
+            now: float) -> Dict[str, Any]:
+        """
+        Validates a token response from the API and caches it.
+
+        Responses already validated by the client are used as they are.
+
+        Args:
+            token_response (Union[TokenResponseModel, Dict[str, Any]]):
+        The API response.
+            now (float): The `time.monotonic()` value when the request
+        was made.
+
+        Returns:
+            Dict[str, Any]: The token response returned to the caller.
+        """
+        validated_response = TokenResponseModel.model_validate(
+            token_response)
+        logger.info("Access token successfully retrieved.")
+
+        self._cached_token = validated_response
+        self._token_expires_at = now + validated_response.expires_in
+
+        return self._build_token_response(
+            validated_response, validated_response.expires_in)
+
+    async def aclose(self) -> None:
+        """
+        Closes the shared client that `get_token_async` uses when no
+        `async_client` was passed in.
+        """
+        if self.async_client is None:
+            await close_default_async_client(self.config.base_url)
+
+    def invalidate(self) -> None:
+        """
+        Discards the cached access token so the next `get_token` call
+        fetches a fresh one, e.g. after the API rejects the token.
+        """
+        self._cached_token = None
+        self._token_expires_at = 0.0
+
+    def _build_token_response(
+            self, token: TokenResponseModel,
+            expires_in: int) -> Dict[str, Any]:
+        """
+        Builds the dictionary returned by `get_token`.
+
+        Args:
+            token (TokenResponseModel): The validated token response.
+            expires_in (int): Seconds remaining until the token expires.
+
+        Returns:
+            Dict[str, Any]: The access token, token type, and expiration
+            details (expires_in and valid_for).
+        """
+        return {
+                "access_token": token.access_token,
+                "token_type": token.token_type,
+                "expires_in": expires_in,
+                "valid_for": self.convert_expiry_time(expires_in)
+            }
 
     def convert_expiry_time(self, expiry_seconds):
         """
@@ -125,3 +305,53 @@ class Auth:
                 f"{seconds} second{'s' if seconds > 1 else ''}")
 
         return ', '.join(readable_expiry) if readable_expiry else "0 seconds"
+
+
+def get_default_auth(
+        base_url: str, client_key: str, client_secret: str) -> Auth:
+    """
+    Returns the shared Auth instance for the given credentials, creating
+    it on first use.
+
+    Every caller using the same credentials reads from the same token
+    cache, so a burst of requests triggers a single token fetch.
+
+    Args:
+        base_url (str): The base URL of the M-Pesa API.
+        client_key (str): The client key for authentication.
+        client_secret (str): The client secret for authentication.
+
+    Returns:
+        Auth: The shared Auth instance for these credentials.
+    """
+    key = (str(base_url), client_key, client_secret)
+    auth = _default_auths.get(key)
+    if auth is None:
+        with _default_auths_lock:
+            auth = _default_auths.get(key)
+            if auth is None:
+                auth = Auth(base_url, client_key, client_secret)
+                _default_auths[key] = auth
+    return auth
+
+
+def get_access_token(
+        base_url: str, client_key: str, client_secret: str) -> str:
+    """
+    Returns a valid access token from the shared Auth instance.
+
+    A cached token is returned until it is close to expiry. Pass a
+    callable wrapping this function as the `access_token` of STKPush or
+    B2C to have tokens refreshed transparently, e.g.
+    `functools.partial(get_access_token, base_url, key, secret)`.
+
+    Args:
+        base_url (str): The base URL of the M-Pesa API.
+        client_key (str): The client key for authentication.
+        client_secret (str): The client secret for authentication.
+
+    Returns:
+        str: The access token.
+    """
+    return get_default_auth(
+        base_url, client_key, client_secret).get_token()["access_token"]
@@ -4,7 +4,9 @@ Data models for the M-Pesa SDK.
 
 Defines schemas for configuration and token response validation.
 """
-from pydantic.v1 import BaseModel, Field, AnyHttpUrl, validator
+from pydantic import (
+    BaseModel, Field, AnyHttpUrl, ValidationInfo, field_validator
+)
 
 
 class ConfigModel(BaseModel):
@@ -21,13 +23,21 @@ class ConfigModel(BaseModel):
     client_secret: str = Field(
         ..., description="Client secret for authentication")
 
-    @validator("client_key", "client_secret")
-    def validate_non_empty_string(cls, value, field):
+    @field_validator("base_url")
+    def convert_base_url_to_string(cls, value):
+        """
+        Convert base_url to a string without the trailing slash that
+        URL validation appends, so endpoints can be joined directly.
+        """
+        return str(value).rstrip("/")
+
+    @field_validator("client_key", "client_secret")
+    def validate_non_empty_string(cls, value, info: ValidationInfo):
         """
         Ensure that the value is not an empty string or only whitespace.
         """
         if not value.strip():
-            raise ValueError(f"{field.name} cannot be an empty string")
+            raise ValueError(f"{info.field_name} cannot be an empty string")
         return value
 
 
@@ -44,7 +54,7 @@ class TokenResponseModel(BaseModel):
     token_type: str = Field(..., description="Type of token (e.g., Bearer)")
     expires_in: int = Field(..., description="Token expiry time in seconds")
 
-    @validator("expires_in", pre=True)
+    @field_validator("expires_in", mode="before")
     def parse_expires_in(cls, value):
         """
         Converts expires_in to an integer if provided as a string.
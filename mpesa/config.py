@@ -3,26 +3,36 @@
 Load environment variables and configure API settings
 for the application.
 """
-from typing import Optional, Dict
+from typing import Optional, Dict, Set
 from dotenv import load_dotenv
 from os import getenv, environ
 
+# Request timeout in seconds used when TIMEOUT is not set.
+DEFAULT_TIMEOUT = 10
+
 
 class Config:
     """
     Configuration class to load and manage environment variables
     for the application from either a '.env' file or system environment.
     """
+    _loaded_env_files: Set[str] = set()
+
     @classmethod
     def load_config(cls, env_file: str = '.env') -> None:
         """
         Load environment variables from a specified .env file,
         but allow overriding with system environment variables.
 
+        Each .env file is parsed only once per process; later calls
+        only refresh the class attributes from the environment.
+
         Args:
             env_file (str): Path to the .env file (default is '.env').
         """
-        load_dotenv(env_file)
+        if env_file not in cls._loaded_env_files:
+            load_dotenv(env_file)
+            cls._loaded_env_files.add(env_file)
 
         cls.BASE_URL = getenv("BASE_URL", "https://apisandbox.safaricom.et")
         cls.TOKEN_GENERATE_ENDPOINT = getenv(
@@ -38,9 +48,12 @@ class Config:
 
         cls.CLIENT_KEY = getenv('CLIENT_KEY')
         cls.CLIENT_SECRET = getenv('CLIENT_SECRET')
-        cls.TIMEOUT = getenv('TIMEOUT')
+        # Parsed once here so HTTP clients can use it directly.
+        cls.TIMEOUT = float(getenv('TIMEOUT') or DEFAULT_TIMEOUT)
         cls.MPESA_LOG_DIR = getenv('MPESA_LOG_DIR')
         cls.LOG_LEVEL = getenv('LOG_LEVEL')
+        cls.LOG_QUEUE = getenv('LOG_QUEUE', '').lower() in (
+            '1', 'true', 'yes')
         cls.ENVIRONMENT = getenv('ENVIRONMENT')
 
     @classmethod
@@ -80,6 +93,7 @@ class Config:
             "TIMEOUT": cls.TIMEOUT,
             "MPESA_LOG_DIR": cls.MPESA_LOG_DIR,
             "LOG_LEVEL": cls.LOG_LEVEL,
+            "LOG_QUEUE": cls.LOG_QUEUE,
             "ENVIRONMENT": cls.ENVIRONMENT
             }
         return config_values
@@ -12,9 +12,9 @@ business use cases, such as:
 - Promotional payouts
 - Loan disbursements
 """
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Union, TYPE_CHECKING
 from mpesa.config import Config
-from mpesa.utils.client import APIClient
+from mpesa.utils.client import APIClient, get_default_async_client
 from mpesa.payments.models import B2CRequestModel
 from mpesa.payments.stk_push import STKPush
 from mpesa.utils.logger import get_logger
@@ -24,6 +24,9 @@ from mpesa.utils.exceptions import (
         TooManyRedirects, ValidationError
         )
 
+if TYPE_CHECKING:
+    from mpesa.utils.async_client import AsyncAPIClient
+
 logger = get_logger(__name__)
 
 
@@ -34,27 +37,40 @@ class B2C(STKPush):
     features, such as API communication and authentication, while adding
     specific capabilities for B2C transactions.
     """
+    __slots__ = ("endpoint",)
+
     def __init__(
-            self, base_url: str, access_token: str, client: APIClient = None):
+            self, base_url: str,
+            access_token: Union[str, Callable[[], str]],
+            client: APIClient = None, async_client: "AsyncAPIClient" = None):
         """
         Initialize a B2C instance.
 
         Args:
             base_url (str): The base URL for the M-PESA API.
-            access_token (str): Access token for authenticating API requests.
+            access_token (Union[str, Callable[[], str]]): Access token
+        for authenticating API requests, or a callable returning one that
+        is called before every request.
             client (APIClient, optional): Custom HTTP client.
-        Defaults to an internal `APIClient`.
+        Defaults to the shared `APIClient` for `base_url`.
+            async_client (AsyncAPIClient, optional): Client used by
+        `make_payment_async`. Defaults to the shared `AsyncAPIClient` for
+        `base_url` on the running event loop.
         """
-        super().__init__(base_url, access_token, client)
+        super().__init__(base_url, access_token, client, async_client)
         self.endpoint = Config.B2C_PAYMENT_REQUEST_ENDPOINT
 
-    def make_payment(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def make_payment(
+            self, payload: Union[Dict[str, Any], B2CRequestModel]
+            ) -> Dict[str, Any]:
         """
         Initiate a B2C payment request.
 
         Args:
-            payload (Dict[str, Any]): Payment request data conforming
-        to `B2CRequestModel`.
+            payload (Union[Dict[str, Any], B2CRequestModel]): Payment
+        request data conforming to `B2CRequestModel`. A model instance is
+        not validated again, so callers retrying a payment can validate
+        once and reuse it.
 
         Returns:
             Dict[str, Any]: API response data.
@@ -68,19 +84,60 @@ class B2C(STKPush):
             NetworkError: If there are connectivity issues.
         """
         try:
-            b2c_payload = B2CRequestModel(**payload).model_dump()
+            b2c_payload = B2CRequestModel.model_validate(payload).model_dump()
             logger.info(
-                f"Initiating B2C payment to endpoint: {self.endpoint}" +
-                "with payload: {b2c_payload}"
-            )
+                "Initiating B2C payment to endpoint: %s", self.endpoint)
 
             response = self.client.post(
-                self.endpoint, headers=self.headers, data=b2c_payload
+                self.endpoint, headers=self._get_headers(),
+                data=b2c_payload
             )
-            logger.info(
-                f"Payment request successful. Response: {response.text}")
+            logger.info("Payment request successful.")
+            logger.debug("B2C payment response: %s", response)
             return response
         except (APIError, AuthenticationError,
                 TimeoutError, NetworkError, HTTPError,
                 TooManyRedirects, ValidationError) as e:
             self.client.handle_exception(type(e), e, __name__)
+
+    async def make_payment_async(
+            self, payload: Union[Dict[str, Any], B2CRequestModel]
+            ) -> Dict[str, Any]:
+        """
+        Asynchronous variant of `make_payment`.
+
+        Bulk payouts can be sent concurrently with `asyncio.gather`, all
+        sharing one asynchronous client's connection pool.
+
+        Args:
+            payload (Union[Dict[str, Any], B2CRequestModel]): Payment
+        request data conforming to `B2CRequestModel`.
+
+        Returns:
+            Dict[str, Any]: API response data.
+
+        Raises:
+            APIError: If there's an error with the API call.
+            ValidationError: If the payload is invalid.
+            TimeoutError: If the request times out.
+            HTTPError: For HTTP-related errors.
+            NetworkError: If there are connectivity issues.
+        """
+        client = self.async_client or get_default_async_client(
+            self.base_url)
+        try:
+            b2c_payload = B2CRequestModel.model_validate(payload).model_dump()
+            logger.info(
+                "Initiating B2C payment to endpoint: %s", self.endpoint)
+
+            response = await client.post(
+                self.endpoint, headers=self._get_headers(),
+                data=b2c_payload
+            )
+            logger.info("Payment request successful.")
+            logger.debug("B2C payment response: %s", response)
+            return response
+        except (APIError, AuthenticationError,
+                TimeoutError, NetworkError, HTTPError,
+                TooManyRedirects, ValidationError) as e:
+            client.handle_exception(type(e), e, __name__)
@@ -11,16 +11,23 @@ Features:
   notifications.
 - Initiating payment requests from customers to businesses.
 """
-from typing import Dict, Any
+from typing import Dict, Any, TYPE_CHECKING
 from mpesa.config import Config
 from mpesa.payments.models import RegisterURLRequest, PaymentRequest
-from mpesa.utils.client import APIClient
+from mpesa.utils.client import (
+        APIClient, close_default_async_client, get_default_async_client,
+        get_default_client
+        )
 from mpesa.utils.logger import get_logger
 from mpesa.utils.exceptions import (
         APIError, AuthenticationError,
         TimeoutError, NetworkError, HTTPError,
         TooManyRedirects, ValidationError
         )
+
+if TYPE_CHECKING:
+    from mpesa.utils.async_client import AsyncAPIClient
+
 logger = get_logger(__name__)
 
 
@@ -30,17 +37,25 @@ class C2B:
     registration of URLs for handling validation and confirmation notifications
     and initiating payment requests for customer-to-business transactions.
     """
-    def __init__(self, base_url: str, client: APIClient = None):
+    __slots__ = ("base_url", "client", "async_client")
+
+    def __init__(
+            self, base_url: str, client: APIClient = None,
+            async_client: "AsyncAPIClient" = None):
         """
         Initializes the C2B class with the base URL and an optional API client.
 
         Args:
             base_url (str): The base URL for the M-Pesa API.
             client (APIClient, optional): An instance of the APIClient.
-           If not provided, a new instance will be created.
+           If not provided, the shared client for `base_url` is used.
+            async_client (AsyncAPIClient, optional): Client used by
+           `register_url_async`. Defaults to the shared `AsyncAPIClient`
+           for `base_url` on the running event loop.
         """
         self.base_url = base_url
-        self.client = client or APIClient(base_url)
+        self.client = client or get_default_client(base_url)
+        self.async_client = async_client
 
     def register_url(
             self, username: str, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -79,10 +94,47 @@ class C2B:
         except (APIError, AuthenticationError,
                 TimeoutError, NetworkError, HTTPError,
                 TooManyRedirects, ValidationError) as e:
-            logger.error(
-                f"Failed to register C2B URLs due to {str(e)}.")
+            logger.error("Failed to register C2B URLs due to %s.", e)
             self.client.handle_exception(type(e), e, __name__)
 
+    async def register_url_async(
+            self, username: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Asynchronous variant of `register_url`.
+
+        Args:
+            username (str): The API key for authenticating the request.
+            payload (Dict[str, Any]): A dictionary containing the registration
+        payload data.
+
+        Returns:
+            Dict[str, Any]: The response from the M-Pesa API.
+
+        Raises:
+            APIError: If the API returns a general error.
+            TimeoutError: If the request times out.
+            NetworkError: If there is a network issue.
+            HTTPError: If the server returns an HTTP error.
+            TooManyRedirects: If too many redirects occur.
+            ValidationError: If the provided payload fails schema validation.
+        """
+        client = self.async_client or get_default_async_client(
+            self.base_url)
+        endpoint = Config.C2B_REGISTER_URL_ENDPOINT
+        params = {"apikey": username}
+        try:
+            validated_payload = RegisterURLRequest(**payload).model_dump()
+            response = await client.post(
+                    endpoint, params=params, data=validated_payload
+            )
+            logger.info("Successfully registered C2B URLs.")
+            return response
+        except (APIError, AuthenticationError,
+                TimeoutError, NetworkError, HTTPError,
+                TooManyRedirects, ValidationError) as e:
+            logger.error("Failed to register C2B URLs due to %s.", e)
+            client.handle_exception(type(e), e, __name__)
+
     def make_payment(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
         Processes a customer-initiated payment through the M-Pesa API.
@@ -114,5 +166,13 @@ class C2B:
         except (APIError, AuthenticationError,
                 TimeoutError, NetworkError, HTTPError,
                 TooManyRedirects, ValidationError) as e:
-            logger.error(f"Failed to process payment due to {str(e)}.")
+            logger.error("Failed to process payment due to %s.", e)
             self.client.handle_exception(type(e), e, __name__)
+
+    async def aclose(self) -> None:
+        """
+        Closes the shared client that `register_url_async` uses when no
+        `async_client` was passed in.
+        """
+        if self.async_client is None:
+            await close_default_async_client(self.base_url)
@@ -1,7 +1,8 @@
 #!/usr/bin/python3
 
-from pydantic import BaseModel, Field, HttpUrl, condecimal, validator
+from pydantic import BaseModel, Field, condecimal
 from typing import List
+from .types import UrlStr
 
 
 class B2CRequestModel(BaseModel):
@@ -30,26 +31,12 @@ class B2CRequestModel(BaseModel):
     Remarks: str = Field(
         ..., description="Additional information to be associated with the " +
         "transaction.", max_length=100)
-    QueueTimeOutURL: HttpUrl = Field(
+    QueueTimeOutURL: UrlStr = Field(
         ..., description="URL to send notification if the payment request " +
         "times out.")
-    ResultURL: HttpUrl = Field(
+    ResultURL: UrlStr = Field(
         ..., description="URL to send notification upon processing of the " +
         "payment request.")
     Occassion: str = Field(
         None, description="Additional information to be associated with the " +
         "transaction.", max_length=100)
-
-    @validator('QueueTimeOutURL', pre=False, always=True)
-    def convert_queue_timeout_url_to_string(cls, value):
-        """
-        Convert QueueTimeOutURL to a string after validation.
-        """
-        return str(value)
-
-    @validator('ResultURL', pre=False, always=True)
-    def convert_result_url_to_string(cls, value):
-        """
-        Convert ResultURL to a string after validation.
-        """
-        return str(value)
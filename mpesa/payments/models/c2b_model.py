@@ -1,7 +1,8 @@
 #!/usr/bin/python3
 
-from pydantic import BaseModel, Field, HttpUrl, condecimal, validator, constr
+from pydantic import BaseModel, Field, condecimal, constr
 from typing import List, Optional
+from .types import UrlStr
 
 
 class RegisterURLRequest(BaseModel):
@@ -21,27 +22,13 @@ class RegisterURLRequest(BaseModel):
         ..., pattern=r'^RegisterURL$',
         description="Differentiates the service from others. " +
         "Must be 'RegisterURL'.")
-    ConfirmationURL: HttpUrl = Field(
+    ConfirmationURL: UrlStr = Field(
         ..., description="URL to receive confirmation request upon " +
         "payment completion.")
-    ValidationURL: HttpUrl = Field(
+    ValidationURL: UrlStr = Field(
         ..., description="URL to receive validation request upon " +
         "payment submission.")
 
-    @validator('ConfirmationURL', pre=False, always=True)
-    def convert_confirmation_url_to_string(cls, value):
-        """
-        Convert ConfirmationURL to a string after validation.
-        """
-        return str(value)
-
-    @validator('ValidationURL', pre=False, always=True)
-    def convert_validation_url_to_string(cls, value):
-        """
-        Convert ValidationURL to a string after validation.
-        """
-        return str(value)
-
 
 class ParameterItem(BaseModel):
     key: str = Field(
@@ -0,0 +1,10 @@
+#!/usr/bin/python3
+"""
+Reusable field types for the payment request models.
+"""
+from pydantic import AfterValidator, HttpUrl
+from typing_extensions import Annotated
+
+# An HTTP(S) URL that is validated by pydantic but stored as a plain
+# string, so validated payloads can be serialized to JSON directly.
+UrlStr = Annotated[HttpUrl, AfterValidator(str)]
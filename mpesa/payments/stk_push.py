@@ -6,19 +6,27 @@ API communication.
 """
 import base64
 from datetime import datetime
-from typing import Dict, Any
-from pydantic import BaseModel, ValidationError
+from typing import (
+        Dict, Any, Callable, Optional, Tuple, Union, TYPE_CHECKING
+        )
+from requests.structures import CaseInsensitiveDict
 from mpesa.auth.auth import Auth
 from mpesa.config import Config
 from mpesa.payments.models import STKPushPayload
 from mpesa.utils.logger import get_logger
-from mpesa.utils.client import APIClient
+from mpesa.utils.client import (
+        APIClient, close_default_async_client, get_default_async_client,
+        get_default_client
+        )
 from mpesa.utils.exceptions import (
         APIError, AuthenticationError,
         TimeoutError, NetworkError, HTTPError,
         TooManyRedirects, ValidationError
         )
 
+if TYPE_CHECKING:
+    from mpesa.utils.async_client import AsyncAPIClient
+
 logger = get_logger(__name__)
 
 
@@ -31,28 +39,80 @@ class STKPush:
     customers' phones for quick and secure transactions. It supports payload
     creation, validation, and API communication.
     """
+    __slots__ = (
+        "base_url", "client", "async_client", "access_token", "headers",
+        "_token_headers")
+
     def __init__(
-            self, base_url: str, access_token: str,
-            client: APIClient = None):
+            self, base_url: str,
+            access_token: Union[str, Callable[[], str]],
+            client: APIClient = None,
+            async_client: "AsyncAPIClient" = None):
         """
         Initializes an instance of the STKPush class.
 
         Args:
             base_url (str): The base URL for the M-PESA API.
-            access_token (str): The access token for authenticating
-        API requests.
+            access_token (Union[str, Callable[[], str]]): The access token
+        for authenticating API requests, or a callable returning one (such
+        as a partial of `get_access_token`), which is called before every
+        request so that expired tokens are refreshed transparently.
             client (APIClient, optional): A custom HTTP client.
-        Defaults to an internal `APIClient` instance.
+        Defaults to the shared `APIClient` for `base_url`. Pass the same
+        client to Auth, STKPush, C2B, and B2C to reuse its connections.
+            async_client (AsyncAPIClient, optional): Client used by the
+        `*_async` methods. Defaults to the shared `AsyncAPIClient` for
+        `base_url` on the running event loop.
         """
         self.base_url = base_url
-        self.client = client or APIClient(base_url)
+        self.client = client or get_default_client(base_url)
+        self.async_client = async_client
         self.access_token = access_token
-        self.headers = {
-            "Authorization": f"Bearer {self.access_token}",
+        self.headers: Optional[CaseInsensitiveDict] = None
+        self._token_headers: Optional[
+            Tuple[str, CaseInsensitiveDict]] = None
+        if not callable(access_token):
+            self.headers = self._build_headers(access_token)
+
+    @staticmethod
+    def _build_headers(access_token: str) -> CaseInsensitiveDict:
+        """
+        Builds the request headers for the given access token.
+
+        Args:
+            access_token (str): The access token for the request.
+
+        Returns:
+            CaseInsensitiveDict: The request headers.
+        """
+        return CaseInsensitiveDict({
+            "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json"
-        }
+        })
+
+    def _get_headers(self) -> CaseInsensitiveDict:
+        """
+        Returns the headers for the next request, fetching the current
+        token first if `access_token` is a callable.
+
+        Headers built for a token are reused until the callable returns
+        a different token.
 
-    def send_stk_push(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        Returns:
+            CaseInsensitiveDict: The request headers.
+        """
+        if self.headers is not None:
+            return self.headers
+        token = self.access_token()
+        token_headers = self._token_headers
+        if token_headers is None or token_headers[0] != token:
+            token_headers = (token, self._build_headers(token))
+            self._token_headers = token_headers
+        return token_headers[1]
+
+    def send_stk_push(
+            self, payload: Union[Dict[str, Any], STKPushPayload]
+            ) -> Dict[str, Any]:
         """
         Initiates an STK Push request to the M-PESA API.
 
@@ -61,8 +121,10 @@ class STKPush:
         errors if they occur.
 
         Args:
-            payload (dict): The request body containing payment details.
-        Must adhere to the `STKPushPayload` model.
+            payload (Union[dict, STKPushPayload]): The request body
+        containing payment details. Must adhere to the `STKPushPayload`
+        model. A model instance is not validated again, so callers
+        retrying a request can validate once and reuse it.
 
         Returns:
             dict: The API response, including transaction details
@@ -77,24 +139,71 @@ class STKPush:
             HTTPError: For HTTP-related errors.
             TooManyRedirects: If too many redirects occur.
         """
+        endpoint = Config.STK_PUSH_ENDPOINT
         try:
-            stk_payload = STKPushPayload(**payload)
-            validated_payload = stk_payload.model_dump()
+            validated_payload = STKPushPayload.model_validate(
+                payload).model_dump()
             logger.info("Payload validation successful.")
-        except ValidationError as e:
+
+            response = self.client.post(
+                    endpoint, headers=self._get_headers(),
+                    data=validated_payload)
+            logger.info(
+                "STK Push request sent successfully. Response: %s", response)
+            return response
+        except (APIError, AuthenticationError,
+                TimeoutError, NetworkError, HTTPError,
+                TooManyRedirects, ValidationError) as e:
             self.client.handle_exception(type(e), e, __name__)
 
+    async def send_stk_push_async(
+            self, payload: Union[Dict[str, Any], STKPushPayload]
+            ) -> Dict[str, Any]:
+        """
+        Asynchronous variant of `send_stk_push`.
+
+        Requests are sent through `async_client`, so many STK Push
+        requests can run concurrently on one event loop.
+
+        Args:
+            payload (Union[dict, STKPushPayload]): The request body
+        containing payment details.
+
+        Returns:
+            dict: The API response.
+
+        Raises:
+            ValidationError: If the payload fails validation.
+            APIError: For general API errors.
+            TimeoutError: For request timeouts.
+            NetworkError: For network connectivity issues.
+            HTTPError: For HTTP-related errors.
+            TooManyRedirects: If too many redirects occur.
+        """
+        client = self.async_client or get_default_async_client(
+            self.base_url)
         endpoint = Config.STK_PUSH_ENDPOINT
         try:
-            response = self.client.post(
-                    endpoint, headers=self.headers, data=validated_payload)
+            validated_payload = STKPushPayload.model_validate(
+                payload).model_dump()
+            response = await client.post(
+                    endpoint, headers=self._get_headers(),
+                    data=validated_payload)
             logger.info(
-                f"STK Push request sent successfully. Response: {response}")
+                "STK Push request sent successfully. Response: %s", response)
             return response
         except (APIError, AuthenticationError,
                 TimeoutError, NetworkError, HTTPError,
                 TooManyRedirects, ValidationError) as e:
-            self.client.handle_exception(type(e), e, __name__)
+            client.handle_exception(type(e), e, __name__)
+
+    async def aclose(self) -> None:
+        """
+        Closes the shared client that `send_stk_push_async` and
+        `make_payment_async` use when no `async_client` was passed in.
+        """
+        if self.async_client is None:
+            await close_default_async_client(self.base_url)
 
     def create_payload(
             self, short_code: str, pass_key: str, **kwargs) -> Dict[str, Any]:
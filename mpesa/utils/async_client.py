@@ -0,0 +1,291 @@
+#!/usr/bin/python3
+"""
+Asynchronous HTTP client for interacting with APIs in the M-Pesa SDK.
+
+This module provides an `asyncio` counterpart to `APIClient` built on a
+long-lived `httpx.AsyncClient`, so one event loop can fan out many
+concurrent requests over a single pool of keep-alive connections.
+It requires the optional `httpx` dependency:
+
+    pip install mpesa_client[async]
+
+Nothing else in the SDK imports this module at import time; the
+`*_async` methods import it on first use, so synchronous users never
+load httpx.
+"""
+import asyncio
+import copy
+from typing import Dict, Any, Optional, Type
+
+try:
+    import httpx
+except ImportError as e:
+    raise ImportError(
+        "The asynchronous client requires httpx. Install it with "
+        "`pip install mpesa_client[async]`.") from e
+
+from pydantic import BaseModel
+from mpesa.config import Config
+from mpesa.utils.client import (
+        _dumps, _loads, backoff_delay, get_cache_key, parse_get_response,
+        raise_for_error_body, GET_RETRIES, RETRY_STATUS_CODES
+        )
+from mpesa.utils.cache import TTLCache
+from mpesa.utils.logger import get_logger
+from mpesa.utils.exceptions import (
+        APIError, TimeoutError, NetworkError, HTTPError,
+        TooManyRedirects
+        )
+from mpesa.utils.error_handler import handle_error
+from mpesa.utils.circuit_breaker import CircuitBreaker
+
+logger = get_logger(__name__)
+
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+
+
+class AsyncAPIClient:
+    """
+    An asynchronous client for making API requests.
+
+    A single instance should be shared by all tasks talking to the same
+    base URL so that they reuse its connection pool. Close it with
+    `aclose()` or use it as an async context manager.
+    """
+    def __init__(
+            self, base_url: Optional[str] = None,
+            timeout: Optional[float] = None, http2: bool = False,
+            circuit_breaker: Optional[CircuitBreaker] = None,
+            cache_ttl: float = 0):
+        """
+        Initialize the AsyncAPIClient instance.
+
+        Args:
+            base_url (str, optional): The base URL for the API.
+        Defaults to `Config.BASE_URL`.
+            timeout (float, optional): The request timeout in seconds.
+        Defaults to `Config.TIMEOUT`.
+            http2 (bool, optional): Enable HTTP/2, which requires the
+        `h2` package. Defaults to False.
+            circuit_breaker (CircuitBreaker, optional): Breaker that
+        fails requests fast while the API is down.
+            cache_ttl (float, optional): Seconds to cache successful GET
+        responses for. Defaults to 0, which disables caching.
+        """
+        self.base_url = base_url or Config.BASE_URL
+        self.timeout = Config.TIMEOUT if timeout is None else timeout
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.cache = TTLCache(cache_ttl) if cache_ttl > 0 else None
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url, timeout=self.timeout, http2=http2,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS))
+
+    async def __aenter__(self):
+        """
+        Enter the async runtime context related to this object.
+
+        Returns:
+            AsyncAPIClient: The client for use in the async with statement.
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Exit the async runtime context and release pooled connections.
+        """
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying connection pool.
+        """
+        await self.client.aclose()
+
+    async def get(
+            self, endpoint: str, headers: Dict[str, str],
+            params: Dict[str, Any],
+            retries: int = GET_RETRIES,
+            response_model: Optional[Type[BaseModel]] = None) -> Any:
+        """
+        Sends a GET request to the specified API endpoint.
+
+        Transient failures are retried, and successful responses cached,
+        as in `APIClient.get`.
+
+        Args:
+            endpoint (str): The API endpoint to query.
+            headers (Dict[str, str]): HTTP headers to include in the request.
+            params (Dict[str, Any]): Query parameters for the request.
+            retries (int, optional): Maximum number of retries.
+        Defaults to `GET_RETRIES`.
+            response_model (Type[BaseModel], optional): Model to validate
+        the response body into, straight from the raw bytes.
+
+        Returns:
+            Any: Parsed JSON response from the API, or an instance of
+            `response_model` when one is given.
+
+        Raises:
+            APIError: For API errors or unparseable responses.
+            AuthenticationError: If the API reports an authentication error.
+            TimeoutError: If the request times out.
+            NetworkError: For connectivity issues.
+            HTTPError: For HTTP error status codes.
+            TooManyRedirects: If too many redirects occur.
+        """
+        if self.cache is not None:
+            cache_key = get_cache_key(
+                endpoint, headers, params, response_model)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return copy.copy(cached)
+
+        response = await self._send(
+            "GET", endpoint, retries=retries, headers=headers, params=params)
+        response_data = parse_get_response(response.content, response_model)
+        if self.cache is not None:
+            self.cache.set(cache_key, copy.copy(response_data))
+        return response_data
+
+    async def post(self, endpoint: str,
+                   headers: Optional[Dict[str, str]] = None,
+                   data: Optional[Dict[str, Any]] = None,
+                   params: Optional[Dict[str, str]] = None
+                   ) -> Dict[str, Any]:
+        """
+        Sends a POST request to the specified API endpoint.
+
+        Args:
+            endpoint (str): The API endpoint to query.
+            headers (Dict[str, str], optional): HTTP headers to include
+        in the request.
+            data (Any): The request payload.
+            params (Dict[str, str], optional): Query parameters for the
+        request.
+
+        Returns:
+            Dict[str, Any]: Parsed JSON response from the API.
+
+        Raises:
+            APIError: For API errors or unparseable responses.
+            TimeoutError: If the request times out.
+            NetworkError: For connectivity issues.
+            HTTPError: For HTTP error status codes.
+            TooManyRedirects: If too many redirects occur.
+        """
+        headers = {"Content-Type": "application/json", **(headers or {})}
+        response = await self._send(
+            "POST", endpoint, headers=headers, params=params,
+            content=_dumps(data))
+        return self._parse(response)
+
+    async def _send(
+            self, method: str, endpoint: str, retries: int = 0,
+            **kwargs) -> httpx.Response:
+        """
+        Sends a request through the circuit breaker and converts httpx
+        errors into SDK exceptions.
+
+        The request counts as one success or failure for the circuit
+        breaker, however many attempts it takes, as in `APIClient`.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The API endpoint, relative to the base URL.
+            retries (int, optional): Maximum number of retries. Only
+        idempotent requests should pass it.
+            **kwargs: Extra arguments for `httpx.AsyncClient.request`.
+
+        Returns:
+            httpx.Response: The successful HTTP response.
+        """
+        self.circuit_breaker.before_call()
+        try:
+            response = await self._send_with_retries(
+                method, endpoint, retries, **kwargs)
+        except BaseException:
+            # Includes cancellation: a half-open probe must always
+            # settle the circuit.
+            self.circuit_breaker.on_failure()
+            raise
+        if response.status_code >= 500:
+            self.circuit_breaker.on_failure()
+        else:
+            self.circuit_breaker.on_success()
+
+        if response.is_error:
+            raise_for_error_body(response.content)
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            handle_error(HTTPError(str(e)), __name__)
+        return response
+
+    async def _send_with_retries(
+            self, method: str, endpoint: str, retries: int,
+            **kwargs) -> httpx.Response:
+        """
+        Sends a request, retrying timeouts, connection errors, and
+        502/503/504 responses up to `retries` times with exponential
+        backoff and full jitter.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The API endpoint, relative to the base URL.
+            retries (int): Maximum number of retries.
+            **kwargs: Extra arguments for `httpx.AsyncClient.request`.
+
+        Returns:
+            httpx.Response: The last HTTP response.
+        """
+        for attempt in range(retries + 1):
+            try:
+                response = await self.client.request(
+                    method, endpoint, **kwargs)
+            except httpx.TooManyRedirects:
+                handle_error(TooManyRedirects(), __name__)
+            except httpx.TransportError as e:
+                if attempt == retries:
+                    if isinstance(e, httpx.TimeoutException):
+                        handle_error(TimeoutError(), __name__)
+                    handle_error(NetworkError(str(e)), __name__)
+            else:
+                if (response.status_code not in RETRY_STATUS_CODES
+                        or attempt == retries):
+                    return response
+            await asyncio.sleep(backoff_delay(attempt))
+
+    def _parse(self, response: httpx.Response) -> Dict[str, Any]:
+        """
+        Decodes the JSON body of a response.
+
+        Args:
+            response (httpx.Response): The HTTP response object.
+
+        Returns:
+            Dict[str, Any]: The parsed JSON body.
+        """
+        try:
+            return _loads(response.content)
+        except ValueError as e:
+            handle_error(APIError(str(e)), __name__)
+
+    def handle_exception(
+            self, exc_type: Type[Exception], e: Exception,
+            module: str) -> None:
+        """
+        Handles exceptions by passing the exception to the
+        handle_error function.
+
+        The original exception instance is re-raised so that its type
+        and mitigation are preserved.
+
+        Args:
+            exc_type (Type[Exception]): The type of the exception.
+            e (Exception): The exception instance that was caught.
+            module (str): The name of the module where the exception occurred.
+        """
+        handle_error(e, module)
@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+"""
+A small thread-safe TTL cache used by the M-Pesa SDK HTTP clients.
+
+It avoids a third-party dependency for the one place the SDK caches
+responses: parsed bodies of idempotent GET requests.
+"""
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+CACHE_MAXSIZE = 1024
+
+
+class TTLCache:
+    """
+    A bounded mapping whose entries expire `ttl` seconds after insertion.
+
+    When the cache is full, the oldest entry is evicted first.
+    """
+    def __init__(self, ttl: float, maxsize: int = CACHE_MAXSIZE):
+        """
+        Initialize the TTLCache instance.
+
+        Args:
+            ttl (float): Seconds an entry stays valid.
+            maxsize (int, optional): Maximum number of entries.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the value stored for `key`, or None if it is missing or
+        has expired.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Optional[Any]: The cached value.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return None
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores `value` under `key`, evicting the oldest entry if full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to store.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+"""
+Circuit breaker for the M-Pesa SDK HTTP clients.
+
+When the API keeps failing (timeouts, connection errors, or 5xx
+responses), the breaker opens and further requests fail immediately
+with `CircuitOpenError` instead of each waiting for the full timeout.
+After `reset_timeout` seconds a single probe request is let through;
+if it succeeds the breaker closes again, otherwise it re-opens.
+"""
+import threading
+import time
+from mpesa.utils.exceptions import CircuitOpenError
+
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 30
+
+
+class CircuitBreaker:
+    """
+    A thread-safe closed/open/half-open circuit breaker.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures that open the circuit.
+        reset_timeout (float): Seconds to wait before probing again.
+        state (str): One of `CLOSED`, `OPEN`, or `HALF_OPEN`.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+            self, failure_threshold: int = FAILURE_THRESHOLD,
+            reset_timeout: float = RESET_TIMEOUT):
+        """
+        Initialize the CircuitBreaker instance.
+
+        Args:
+            failure_threshold (int, optional): Consecutive failures that
+        open the circuit.
+            reset_timeout (float, optional): Seconds to wait before
+        letting a probe request through.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """
+        Checks whether a request may be sent.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a
+        probe request already in flight.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            remaining = self.reset_timeout - (
+                time.monotonic() - self._opened_at)
+            if self.state == self.OPEN and remaining <= 0:
+                self.state = self.HALF_OPEN
+                return
+            raise CircuitOpenError(max(remaining, 0))
+
+    def on_success(self) -> None:
+        """
+        Records a successful request and closes the circuit.
+        """
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+
+    def on_failure(self) -> None:
+        """
+        Records a failed request, opening the circuit when the failed
+        request was a probe or the failure threshold is reached.
+        """
+        with self._lock:
+            self._failures += 1
+            if (self.state == self.HALF_OPEN
+                    or self._failures >= self.failure_threshold):
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
@@ -5,9 +5,19 @@ HTTP client for interacting with APIs in the M-Pesa SDK.
 This module provides a reusable client for sending HTTP requests
 and processing responses from RESTful APIs, with robust error handling.
 """
-import logging
-from typing import Dict, Any, Type
+import asyncio
+import copy
+import random
+import socket
+import threading
+import time
+import weakref
+from typing import Dict, Any, Optional, Tuple, Type, TYPE_CHECKING
 import requests
+from pydantic import BaseModel, ValidationError as ValError
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 from requests.exceptions import (
     Timeout,
     HTTPError as http,
@@ -20,12 +30,88 @@ from mpesa.utils.logger import get_logger
 from mpesa.utils.exceptions import (
         APIError, AuthenticationError,
         TimeoutError, NetworkError, HTTPError,
-        TooManyRedirects, ValidationError
+        TooManyRedirects, ValidationError,
+        authentication_error
         )
 from mpesa.utils.error_handler import handle_error
+from mpesa.utils.circuit_breaker import CircuitBreaker
+from mpesa.utils.cache import TTLCache
+
+if TYPE_CHECKING:
+    from mpesa.utils.async_client import AsyncAPIClient
+
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    import json
+
+    def _dumps(data: Any) -> bytes:
+        """Serialize `data` to compact UTF-8 encoded JSON."""
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
 
 logger = get_logger(__name__)
 
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = 100
+# Only connection failures are retried: nothing has reached the server
+# yet, so it is safe even for payment requests.
+CONNECT_RETRIES = 2
+# GET requests are idempotent, so transient failures are also retried
+# with exponential backoff and full jitter. POSTs are never retried.
+GET_RETRIES = 3
+BACKOFF_BASE = 0.2
+BACKOFF_CAP = 5.0
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+
+# Probe idle pooled connections so NAT gateways and load balancers do
+# not silently drop them, which would force a new DNS lookup, TCP
+# connect, and TLS handshake on the next request.
+KEEPALIVE_IDLE = 60
+KEEPALIVE_INTERVAL = 20
+KEEPALIVE_COUNT = 3
+
+
+def _keepalive_socket_options():
+    """
+    Returns urllib3 socket options enabling TCP keep-alive probes.
+
+    The idle, interval, and count options are only added on platforms
+    that expose them.
+
+    Returns:
+        list: Socket options for `urllib3` connections.
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    for name, value in (("TCP_KEEPIDLE", KEEPALIVE_IDLE),
+                        ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+                        ("TCP_KEEPCNT", KEEPALIVE_COUNT)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter whose pooled connections use TCP keep-alive probes.
+    """
+    def init_poolmanager(self, *args, **kwargs):
+        """
+        Initialize the pool manager with keep-alive socket options.
+        """
+        kwargs.setdefault("socket_options", _keepalive_socket_options())
+        super().init_poolmanager(*args, **kwargs)
+
+
+_default_clients: Dict[str, "APIClient"] = {}
+_default_clients_lock = threading.Lock()
+# Maps each event loop to its {base_url: AsyncAPIClient} dict. httpx
+# pools are bound to the loop they were first used on, so the shared
+# async clients are kept per loop and dropped with it.
+_default_async_clients = weakref.WeakKeyDictionary()
+
 
 class APIClient:
     """
@@ -35,17 +121,43 @@ class APIClient:
     to a specified base URL, and handles API responses, including
     error codes, using custom exceptions.
     """
-    def __init__(self, base_url: str, timeout: int = 10):
+    def __init__(
+            self, base_url: Optional[str] = None,
+            timeout: Optional[float] = None,
+            circuit_breaker: Optional[CircuitBreaker] = None,
+            cache_ttl: float = 0, trust_env: bool = True):
         """
         Initialize the APIClient instance.
 
         Args:
-            base_url (str): The base URL for the API.
-            timeout (int, optional): The request timeout in seconds.
+            base_url (str, optional): The base URL for the API.
+        Defaults to `Config.BASE_URL`.
+            timeout (float, optional): The request timeout in seconds.
+        Defaults to `Config.TIMEOUT`.
+            circuit_breaker (CircuitBreaker, optional): Breaker that
+        fails requests fast while the API is down. Defaults to a new
+        `CircuitBreaker` with the default thresholds.
+            cache_ttl (float, optional): Seconds to cache successful GET
+        responses for. Defaults to 0, which disables caching.
+            trust_env (bool, optional): Read proxy, netrc, and CA bundle
+        settings from the environment on every request. Pass False when
+        they are not needed to skip that per-request lookup.
+        Defaults to True.
         """
-        self.base_url = base_url
-        self.timeout = timeout
+        self.base_url = base_url or Config.BASE_URL
+        self.timeout = Config.TIMEOUT if timeout is None else timeout
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.cache = TTLCache(cache_ttl) if cache_ttl > 0 else None
+        self._url_cache: Dict[str, str] = {}
         self.session = requests.Session()
+        self.session.trust_env = trust_env
+        adapter = KeepAliveAdapter(
+            pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(
+                total=CONNECT_RETRIES, connect=CONNECT_RETRIES,
+                read=0, other=0, backoff_factor=0.2))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def __enter__(self):
         """
@@ -61,86 +173,226 @@ class APIClient:
         Exit the runtime context and clean up resources.
         Closes the session to release connections.
         """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the underlying session and its pooled connections.
+        """
         self.session.close()
 
     def get(
             self, endpoint: str, headers: Dict[str, str],
-            params: Dict[str, Any]) -> Dict[str, Any]:
+            params: Dict[str, Any],
+            retries: int = GET_RETRIES,
+            response_model: Optional[Type[BaseModel]] = None) -> Any:
         """
         Sends a GET request to the to the specified API endpoint.
 
+        Timeouts, connection errors, and 502/503/504 responses are
+        retried up to `retries` times with exponential backoff and full
+        jitter. The circuit breaker records the whole request, retries
+        included, as a single success or failure. When the client has a
+        `cache_ttl`, successful responses are cached per endpoint,
+        headers, and query parameters.
+
         Args:
             endpoint (str): The API endpoint to query.
             headers (Dict[str, str]): HTTP headers to include in the request.
             params (Dict[str, Any]): Query parameters for the request.
-            timeout (int, optional): The request timeout in seconds.
-            Defaults to 10.
+            retries (int, optional): Maximum number of retries.
+        Defaults to `GET_RETRIES`.
+            response_model (Type[BaseModel], optional): Model to validate
+        the response body into, straight from the raw bytes.
 
         Returns:
-            Dict[str, Any]: Parsed JSON response from the API.
+            Any: Parsed JSON response from the API, or an instance of
+            `response_model` when one is given.
 
         Raises:
             APIError: For network issues, timeouts, or unexpected errors.
         """
-        url = f"{self.base_url}{endpoint}"
+        if self.cache is not None:
+            cache_key = get_cache_key(
+                endpoint, headers, params, response_model)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return copy.copy(cached)
+
+        url = self._get_url(endpoint)
         try:
-            response = self.session.get(
-                url, headers=headers, params=params,
-                timeout=self.timeout)
+            response = self._send(
+                self.session.get, url, retries,
+                headers=headers, params=params)
+            if response.status_code >= 400:
+                raise_for_error_body(response.content)
             response.raise_for_status()
-            return self._handle_get_response(response)
+            response_data = self._handle_get_response(
+                response, response_model)
+            if self.cache is not None:
+                self.cache.set(cache_key, copy.copy(response_data))
+            return response_data
         except (APIError, AuthenticationError,
                 TimeoutError, NetworkError, http,
                 many, ValidationError) as e:
             self.handle_exception(type(e), e, __name__)
 
+    def _get_url(self, endpoint: str) -> str:
+        """
+        Returns the full URL for `endpoint`, memoized per endpoint since
+        the SDK only calls a handful of fixed endpoints.
+
+        Args:
+            endpoint (str): The API endpoint.
+
+        Returns:
+            str: The base URL joined with the endpoint.
+        """
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache.setdefault(
+                endpoint, f"{self.base_url}{endpoint}")
+        return url
+
+    def _send(
+            self, send, url: str, retries: int = 0,
+            **kwargs) -> requests.Response:
+        """
+        Sends a request through the circuit breaker.
+
+        The request counts as one success or failure, however many
+        attempts it takes. Any exception raised while sending (timeouts,
+        connection errors, broken responses, too many redirects,
+        interruptions) and a final 5xx response count as failures, so a
+        half-open probe always settles the circuit; any other response
+        closes it.
+
+        Args:
+            send (Callable): The session method to call.
+            url (str): The full request URL.
+            retries (int, optional): Maximum number of retries. Only
+        idempotent requests should pass it.
+            **kwargs: Extra arguments for the session method.
+
+        Returns:
+            requests.Response: The HTTP response.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+        """
+        self.circuit_breaker.before_call()
+        try:
+            response = self._send_with_retries(send, url, retries, **kwargs)
+        except BaseException:
+            self.circuit_breaker.on_failure()
+            raise
+        if response.status_code >= 500:
+            self.circuit_breaker.on_failure()
+        else:
+            self.circuit_breaker.on_success()
+        return response
+
+    def _send_with_retries(
+            self, send, url: str, retries: int,
+            **kwargs) -> requests.Response:
+        """
+        Sends a request, retrying transient failures.
+
+        Args:
+            send (Callable): The session method to call.
+            url (str): The full request URL.
+            retries (int): Maximum number of retries.
+            **kwargs: Extra arguments for the session method.
+
+        Returns:
+            requests.Response: The last HTTP response.
+        """
+        for attempt in range(retries + 1):
+            try:
+                response = send(url, timeout=self.timeout, **kwargs)
+            except (Timeout, ConnectionError):
+                if attempt == retries:
+                    raise
+            else:
+                if (response.status_code not in RETRY_STATUS_CODES
+                        or attempt == retries):
+                    return response
+            delay = backoff_delay(attempt)
+            logger.warning(
+                "Request to %s failed; retrying in %.2fs.", url, delay)
+            time.sleep(delay)
+
     def _handle_get_response(
-            self, response: requests.Response) -> Dict[str, Any]:
+            self, response: requests.Response,
+            response_model: Optional[Type[BaseModel]] = None) -> Any:
         """
         Handle API responses and raise appropriate exceptions for errors.
 
         Args:
             response (requests.Response): The HTTP response object.
+            response_model (Type[BaseModel], optional): Model to validate
+        the response body into.
 
         Returns:
-            Dict[str, Any]: Parsed JSON response if the request is successful.
+            Any: Parsed JSON response if the request is successful, as an
+            instance of `response_model` when one is given.
+        """
+        return parse_get_response(response.content, response_model)
+
+    def _parse_response(
+            self, response: requests.Response) -> Dict[str, Any]:
+        """
+        Decodes the JSON body of a response.
+
+        The raw bytes are parsed with orjson when it is installed and
+        with the standard library otherwise.
+
+        Args:
+            response (requests.Response): The HTTP response object.
+
+        Returns:
+            Dict[str, Any]: The parsed JSON body.
+
+        Raises:
+            APIError: If the body is not valid JSON.
         """
         try:
-            response_data = response.json()
+            return _loads(response.content)
         except ValueError as e:
-            handle_error(APIError(e))
-
-        if "resultCode" in response_data:
-            result_code = response_data.get("resultCode")
-            error_message = response_data.get(
-                "resultDesc", "No description provided")
-            handle_error(
-                AuthenticationError(result_code, error_message))
-        return response_data
+            handle_error(APIError(f"Invalid JSON response: {e}"), __name__)
 
-    def post(self, endpoint: str, headers: Dict[str, str],
-             data: Dict[str, str],
-             params: Dict[str, str] = {}) -> Dict[str, Any]:
+    def post(self, endpoint: str,
+             headers: Optional[Dict[str, str]] = None,
+             data: Optional[Dict[str, Any]] = None,
+             params: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
         Sends a POST request to the specified API endpoint.
 
+        The payload is serialized with orjson when it is installed and
+        with the standard library otherwise.
+
         Args:
             endpoint (str): The API endpoint to query.
-            headers (Dict[str, str]): HTTP headers to include in the
-        request.
+            headers (Dict[str, str], optional): HTTP headers to include
+        in the request.
             data (Any): The request payload.
+            params (Dict[str, str], optional): Query parameters for the
+        request.
 
         Returns:
             Dict[str, Any]: Parsed JSON response from the API.
         """
-        url = f"{self.base_url}{endpoint}"
+        url = self._get_url(endpoint)
+        headers = {"Content-Type": "application/json", **(headers or {})}
         try:
-            response = self.session.post(
-                    url, headers=headers, params=params,
-                    json=data, timeout=self.timeout
+            response = self._send(
+                    self.session.post, url, headers=headers, params=params,
+                    data=_dumps(data)
                     )
+            if response.status_code >= 400:
+                raise_for_error_body(response.content)
             response.raise_for_status()
-            return response.json()
+            return self._parse_response(response)
         except (APIError, AuthenticationError,
                 TimeoutError, NetworkError, HTTPError,
                 TooManyRedirects, ValidationError) as e:
@@ -153,9 +405,202 @@ class APIClient:
         Handles exceptions by passing the exception to the
         handle_error function.
 
+        The original exception instance is re-raised so that its type
+        and mitigation are preserved.
+
         Args:
             exc_type (Type[Exception]): The type of the exception.
             e (Exception): The exception instance that was caught.
             module (str): The name of the module where the exception occurred.
         """
-        handle_error(exc_type(str(e)), module)
+        handle_error(e, module)
+
+
+def parse_get_response(
+        content: bytes,
+        response_model: Optional[Type[BaseModel]] = None) -> Any:
+    """
+    Decodes a successful GET response body.
+
+    With a `response_model`, the raw bytes are validated straight into
+    the model without building an intermediate dictionary. The body is
+    only decoded to a dictionary when validation fails, to check for a
+    `resultCode` error before the validation error is re-raised.
+
+    Args:
+        content (bytes): The raw response body.
+        response_model (Type[BaseModel], optional): Model to validate
+    the body into.
+
+    Returns:
+        Any: The parsed JSON body, or an instance of `response_model`.
+
+    Raises:
+        APIError: If the body is not valid JSON.
+        AuthenticationError: If the body carries a `resultCode`.
+        pydantic.ValidationError: If the body does not match
+    `response_model`.
+    """
+    validation_error = None
+    if response_model is not None:
+        try:
+            return response_model.model_validate_json(content)
+        except ValError as e:
+            validation_error = e
+
+    try:
+        response_data = _loads(content)
+    except ValueError as e:
+        handle_error(APIError(f"Invalid JSON response: {e}"), __name__)
+    if isinstance(response_data, dict) and "resultCode" in response_data:
+        handle_error(authentication_error(
+            response_data["resultCode"],
+            response_data.get("resultDesc", "No description provided")),
+            __name__)
+    if validation_error is not None:
+        raise validation_error
+    return response_data
+
+
+def raise_for_error_body(content: bytes) -> None:
+    """
+    Raises the specific authentication error described by an error
+    response body, if it carries a `resultCode`.
+
+    The raw body is parsed once; bodies that are not JSON objects are
+    ignored so that the caller falls back to the HTTP status.
+
+    Args:
+        content (bytes): The raw body of the HTTP error response.
+
+    Raises:
+        AuthenticationError: If the body carries a `resultCode`.
+    """
+    try:
+        error_data = _loads(content)
+    except ValueError:
+        return
+    if isinstance(error_data, dict) and "resultCode" in error_data:
+        handle_error(authentication_error(
+            error_data["resultCode"],
+            error_data.get("resultDesc", "No description provided")),
+            __name__)
+
+
+def get_cache_key(
+        endpoint: str, headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+        response_model: Optional[Type[BaseModel]] = None) -> Tuple:
+    """
+    Builds the response cache key for a GET request.
+
+    Headers are part of the key so that requests made with different
+    credentials never share a cached response.
+
+    Args:
+        endpoint (str): The API endpoint.
+        headers (Dict[str, str], optional): The request headers.
+        params (Dict[str, Any], optional): The query parameters.
+        response_model (Type[BaseModel], optional): The model the
+    response is validated into.
+
+    Returns:
+        Tuple: A hashable cache key.
+    """
+    return (endpoint, frozenset((headers or {}).items()),
+            frozenset((params or {}).items()), response_model)
+
+
+def backoff_delay(attempt: int) -> float:
+    """
+    Returns a randomized delay before retry number `attempt` + 1.
+
+    Uses exponential backoff with full jitter, so many clients
+    recovering from the same outage do not retry in lockstep.
+
+    Args:
+        attempt (int): The zero-based number of the failed attempt.
+
+    Returns:
+        float: The delay in seconds.
+    """
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+
+def get_default_client(base_url: Optional[str] = None) -> APIClient:
+    """
+    Returns the shared APIClient for the given base URL, creating it on
+    first use.
+
+    Auth, STKPush, C2B, and B2C fall back to this client when none is
+    passed in, so instances built independently still reuse the same
+    pooled keep-alive connections.
+
+    Args:
+        base_url (str, optional): The base URL for the API.
+    Defaults to `Config.BASE_URL`.
+
+    Returns:
+        APIClient: The shared client for `base_url`.
+    """
+    base_url = str(base_url or Config.BASE_URL)
+    client = _default_clients.get(base_url)
+    if client is None:
+        with _default_clients_lock:
+            client = _default_clients.get(base_url)
+            if client is None:
+                client = APIClient(base_url)
+                _default_clients[base_url] = client
+    return client
+
+
+def get_default_async_client(
+        base_url: Optional[str] = None) -> "AsyncAPIClient":
+    """
+    Returns the shared AsyncAPIClient for the given base URL on the
+    running event loop, creating it on first use.
+
+    The `*_async` methods of Auth, STKPush, C2B, and B2C fall back to
+    this client when none is passed in. Each event loop gets its own
+    clients, so a later `asyncio.run()` never reuses a pool bound to a
+    closed loop. httpx is only imported on the first call.
+
+    Args:
+        base_url (str, optional): The base URL for the API.
+    Defaults to `Config.BASE_URL`.
+
+    Returns:
+        AsyncAPIClient: The shared client for `base_url` on this loop.
+
+    Raises:
+        RuntimeError: If called outside a running event loop.
+    """
+    from mpesa.utils.async_client import AsyncAPIClient
+
+    base_url = str(base_url or Config.BASE_URL)
+    loop = asyncio.get_running_loop()
+    with _default_clients_lock:
+        clients = _default_async_clients.setdefault(loop, {})
+        client = clients.get(base_url)
+        if client is None:
+            client = AsyncAPIClient(base_url)
+            clients[base_url] = client
+    return client
+
+
+async def close_default_async_client(base_url: Optional[str] = None) -> None:
+    """
+    Closes the shared AsyncAPIClient for the given base URL on the
+    running event loop and forgets it, so the next request opens a new
+    pool.
+
+    Args:
+        base_url (str, optional): The base URL for the API.
+    Defaults to `Config.BASE_URL`.
+    """
+    base_url = str(base_url or Config.BASE_URL)
+    loop = asyncio.get_running_loop()
+    with _default_clients_lock:
+        client = _default_async_clients.get(loop, {}).pop(base_url, None)
+    if client is not None:
+        await client.aclose()
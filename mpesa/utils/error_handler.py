@@ -18,15 +18,15 @@ def handle_error(exception, module_name=None):
 
     logger = get_logger(module_name or __name__)
     if isinstance(exception, NetworkError):
-        logger.error(f"Network issue: {exception}")
+        logger.error("Network issue: %s", exception)
     elif isinstance(exception, TimeoutError):
-        logger.warning(f"Request timeout: {exception}")
+        logger.warning("Request timeout: %s", exception)
     elif isinstance(exception, AuthenticationError):
-        logger.error(f"Authentication failure: {exception}")
+        logger.error("Authentication failure: %s", exception)
     elif isinstance(exception, APIError):
-        logger.error(f"General API error: {exception}")
+        logger.error("General API error: %s", exception)
     elif isinstance(exception, ValidationError):
-        logger.error(f"Validaion error: {exception}")
+        logger.error("Validaion error: %s", exception)
     else:
-        logger.critical(f"Unexpected error: {exception}")
+        logger.critical("Unexpected error: %s", exception)
     raise exception
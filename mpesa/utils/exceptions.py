@@ -1,5 +1,18 @@
 from pydantic import ValidationError as ValError
 
+_REDIRECTS_MITIGATION = (
+    "Ensure the URL is correct and check for redirection loops.")
+
+
+def _restore_error(error_class, args):
+    """
+    Recreates an SDK exception without calling its `__init__`; the
+    instance attributes are restored by unpickling afterwards.
+    """
+    error = error_class.__new__(error_class)
+    error.args = args
+    return error
+
 
 class APIError(Exception):
     """Base class for all API errors."""
@@ -10,12 +23,20 @@ class APIError(Exception):
     def __str__(self):
         return f"{self.args[0]} | Mitigation: {self.mitigation}"
 
+    def __reduce__(self):
+        """
+        Pickles the exception by its state rather than by re-calling
+        `__init__`, whose signature differs between subclasses.
+        """
+        return _restore_error, (type(self), self.args), self.__dict__
+
 
 class NetworkError(APIError):
     """Error for network connectivity issues."""
-    def __init__(self, message="A network error occurred."):
-        super().__init__(
-            message, "Check your internet connection and retry.")
+    def __init__(
+            self, message="A network error occurred.",
+            mitigation="Check your internet connection and retry."):
+        super().__init__(message, mitigation)
 
 
 class TimeoutError(NetworkError):
@@ -37,26 +58,89 @@ class TooManyRedirects(APIError):
     """Error for excessive redirects."""
     def __init__(self,
                  message="Too many redirects occurred.",
-                 mitigation="Ensure the URL is correct and check " +
-                 "for redirection loops."):
+                 mitigation=_REDIRECTS_MITIGATION):
         super().__init__(message, mitigation)
 
 
+class CircuitOpenError(APIError):
+    """Error for requests rejected while the circuit breaker is open."""
+    def __init__(self, retry_after):
+        super().__init__(
+            "The M-Pesa API is failing; request not sent.",
+            f"Retry after {retry_after:.0f} seconds.")
+        self.retry_after = retry_after
+
+
 class AuthenticationError(APIError):
     """Error for authentication failures."""
-    error_mapping = {
-        "999991": "Ensure the correct client ID is used.",
-        "999996": "Ensure the authentication type is Basic Auth.",
-        "999997": "Ensure the authorization header is correctly formatted.",
-        "999998": "Use client_credentials as the grant type."
-        }
+    # Subclasses for known result codes override this mitigation.
+    mitigation = "Check your authentication details and retry."
 
     def __init__(self, result_code, result_description):
-        mitigation = self.error_mapping.get(
-            result_code, "Check your authentication details and retry.")
-        message = f"Authentication Error - Code: {result_code}, " + \
-            "Description: {result_description}"
-        super().__init__(message, mitigation)
+        message = (f"Authentication Error - Code: {result_code}, "
+                   f"Description: {result_description}")
+        super().__init__(message, type(self).mitigation)
+
+
+class InvalidClientIDError(AuthenticationError):
+    """Error for an invalid client ID (result code 999991)."""
+    result_code = "999991"
+    mitigation = "Ensure the correct client ID is used."
+
+    def __init__(self, result_description="Invalid client ID."):
+        super().__init__(self.result_code, result_description)
+
+
+class InvalidAuthenticationError(AuthenticationError):
+    """Error for an unsupported authentication type (result code 999996)."""
+    result_code = "999996"
+    mitigation = "Ensure the authentication type is Basic Auth."
+
+    def __init__(self, result_description="Invalid authentication type."):
+        super().__init__(self.result_code, result_description)
+
+
+class InvalidAuthorizationHeaderError(AuthenticationError):
+    """Error for a malformed authorization header (result code 999997)."""
+    result_code = "999997"
+    mitigation = "Ensure the authorization header is correctly formatted."
+
+    def __init__(self, result_description="Invalid authorization header."):
+        super().__init__(self.result_code, result_description)
+
+
+class InvalidGrantTypeError(AuthenticationError):
+    """Error for an invalid or missing grant type (result code 999998)."""
+    result_code = "999998"
+    mitigation = "Use client_credentials as the grant type."
+
+    def __init__(self, result_description="Invalid grant type."):
+        super().__init__(self.result_code, result_description)
+
+
+AUTHENTICATION_ERRORS = {
+    error.result_code: error for error in (
+        InvalidClientIDError, InvalidAuthenticationError,
+        InvalidAuthorizationHeaderError, InvalidGrantTypeError)
+    }
+
+
+def authentication_error(result_code, result_description):
+    """
+    Builds the exception matching an API `resultCode`.
+
+    Args:
+        result_code (str): The result code returned by the API.
+        result_description (str): The description returned by the API.
+
+    Returns:
+        AuthenticationError: The specific subclass for known codes, or
+    AuthenticationError itself for unknown ones.
+    """
+    error = AUTHENTICATION_ERRORS.get(result_code)
+    if error is None:
+        return AuthenticationError(result_code, result_description)
+    return error(result_description)
 
 
 class ValidationError(APIError):
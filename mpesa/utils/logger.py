@@ -12,21 +12,124 @@ Key Features:
 - RotatingFileHandler ensures log file management with a
 maximum size of 10MB and keeps up to 5 backup logs.
 - StreamHandler outputs logs to the console for real-time monitoring.
+- Setting LOG_QUEUE=true moves file and console writes to a background
+thread through a QueueHandler/QueueListener pair.
 """
+import atexit
 import os
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from typing import Dict, Tuple
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from mpesa.config import Config
 
 log_dir = Config.MPESA_LOG_DIR if Config.MPESA_LOG_DIR else os.path.join(
     os.getcwd(), "logs")
 log_file_path = os.path.join(log_dir, "mpesa.log")
 
+# Shared by every handler created by get_logger.
+LOG_FORMATTER = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+_file_handlers: Dict[str, RotatingFileHandler] = {}
+_file_handlers_lock = threading.Lock()
+
+
+def _get_file_handler(path: str) -> RotatingFileHandler:
+    """
+    Returns the rotating file handler for `path`, creating it on first use.
+
+    Every SDK logger writing to the same file shares one handler, so the
+    file is opened once and rotation is not raced by several handlers.
+    The file itself is only opened when the first record is written.
+
+    Args:
+        path (str): The path of the log file.
+
+    Returns:
+        RotatingFileHandler: The shared handler for `path`.
+    """
+    with _file_handlers_lock:
+        file_handler = _file_handlers.get(path)
+        if file_handler is None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            file_handler = RotatingFileHandler(
+                    path, maxBytes=10 * 1024 * 1024, backupCount=5,
+                    delay=True
+                    )
+            file_handler.setFormatter(LOG_FORMATTER)
+            _file_handlers[path] = file_handler
+    return file_handler
+
+
+_queue_handlers: Dict[Tuple[str, bool], QueueHandler] = {}
+_queue_listeners: Dict[Tuple[str, bool], QueueListener] = {}
+
+
+def _get_queue_handler(path: str, console: bool) -> QueueHandler:
+    """
+    Returns a QueueHandler whose records are written by a background
+    QueueListener, creating both on first use.
+
+    Logging calls then only enqueue the record, so request threads never
+    block on disk or console I/O.
+
+    Args:
+        path (str): The path of the log file.
+        console (bool): Whether records are also written to the console.
+
+    Returns:
+        QueueHandler: The shared queue handler for this destination.
+    """
+    key = (path, console)
+    with _file_handlers_lock:
+        queue_handler = _queue_handlers.get(key)
+        if queue_handler is not None:
+            return queue_handler
+
+    handlers = [_get_file_handler(path)]
+    if console:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(LOG_FORMATTER)
+        handlers.append(stream_handler)
+
+    with _file_handlers_lock:
+        queue_handler = _queue_handlers.get(key)
+        if queue_handler is None:
+            log_queue = queue.Queue(-1)
+            listener = QueueListener(
+                    log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            queue_handler = QueueHandler(log_queue)
+            _queue_handlers[key] = queue_handler
+            _queue_listeners[key] = listener
+    return queue_handler
+
+
+def _stop_log_listeners() -> None:
+    """
+    Stops the background log listeners, writing out queued records.
+
+    Only meant to run from `atexit`, so queued records are not lost when
+    the process exits. Configured loggers keep their QueueHandler, and
+    nothing reads their queue once the listener has stopped.
+    """
+    with _file_handlers_lock:
+        listeners = list(_queue_listeners.values())
+    for listener in listeners:
+        listener.stop()
+
+
+atexit.register(_stop_log_listeners)
+
 
 def get_logger(name: str) -> logging.Logger:
     """
     This function creates a logger that is module-specific, allowing
-    logs to be traced back to the module that generated them.
+    logs to be traced back to the module that generated them. Loggers
+    that are already configured are returned as is, so calling it again
+    for the same name never adds duplicate handlers.
 
     Args:
         name (str): The name of the module.
@@ -34,25 +137,23 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         logging.Logger: The logger instance for the calling module.
     """
-    formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+
+    log_level = 'DEBUG' if not Config.LOG_LEVEL else Config.LOG_LEVEL
+    logger.setLevel(getattr(logging, log_level, logging.DEBUG))
+    if Config.LOG_QUEUE:
+        logger.addHandler(_get_queue_handler(
+            log_file_path, Config.ENVIRONMENT != 'TEST'))
+        return logger
+
+    logger.addHandler(_get_file_handler(log_file_path))
 
-    if not logger.handlers:
-        log_level = 'DEBUG' if not Config.LOG_LEVEL else Config.LOG_LEVEL
-        logger.setLevel(getattr(logging, log_level, logging.DEBUG))
-        os.makedirs(log_dir, exist_ok=True)
-
-        file_handler = RotatingFileHandler(
-                log_file_path, maxBytes=10 * 1024 * 1024, backupCount=5
-                )
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-
-        if Config.ENVIRONMENT != 'TEST':
-            stream_handler = logging.StreamHandler()
-            stream_handler.setFormatter(formatter)
-            logger.addHandler(stream_handler)
+    if Config.ENVIRONMENT != 'TEST':
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(LOG_FORMATTER)
+        logger.addHandler(stream_handler)
 
     return logger
 
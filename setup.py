@@ -22,6 +22,13 @@ setup(
         "requests-toolbelt>=1.0.0,<2.0.0"
         ],
     extras_require={
+        "speedups": [
+            "orjson>=3.8.0",
+            "pybase64>=1.3.0"
+            ],
+        "async": [
+            "httpx>=0.27.0"
+            ],
         "dev": [
             "build",
             "pycodestyle==2.11.1",
@@ -0,0 +1,17 @@
+#!/usr/bin/python3
+"""
+Unit tests for the M-Pesa SDK.
+
+Log files written while the tests run go to a temporary directory, so
+the suite never touches the project's real `logs/` directory, and SDK
+loggers skip the console unless ENVIRONMENT is already set.
+"""
+import atexit
+import os
+import shutil
+import tempfile
+
+LOG_DIR = tempfile.mkdtemp(prefix="mpesa-test-logs-")
+os.environ["MPESA_LOG_DIR"] = LOG_DIR
+os.environ.setdefault("ENVIRONMENT", "TEST")
+atexit.register(shutil.rmtree, LOG_DIR, ignore_errors=True)
@@ -0,0 +1,264 @@
+#!/usr/bin/python3
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+from mpesa.auth.auth import Auth
+from mpesa.payments.b2c import B2C
+from mpesa.payments.stk_push import STKPush
+from mpesa.utils.client import (
+        close_default_async_client, get_default_async_client, GET_RETRIES
+        )
+from mpesa.utils.circuit_breaker import CircuitBreaker
+from mpesa.utils.exceptions import (
+        AuthenticationError, HTTPError, InvalidGrantTypeError, NetworkError,
+        TimeoutError, TooManyRedirects
+        )
+
+try:
+    import httpx
+    from mpesa.utils.async_client import AsyncAPIClient
+except ImportError:
+    httpx = None
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncAPIClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        """Set up a client backed by a mock transport."""
+        self.requests = []
+        self.status_code = 200
+        self.body = {"ResponseCode": "0"}
+        self.error = None
+        self.client = AsyncAPIClient("https://sandbox.safaricom.et")
+        self.client.client = httpx.AsyncClient(
+            base_url=self.client.base_url,
+            transport=httpx.MockTransport(self._handler))
+
+    async def asyncTearDown(self):
+        """Release the client's pooled connections."""
+        await self.client.aclose()
+
+    def _handler(self, request):
+        """Record the request and return the configured response."""
+        self.requests.append(request)
+        if self.error is not None:
+            raise self.error
+        status_code = self.status_code
+        if isinstance(status_code, list):
+            status_code = status_code.pop(0)
+        return httpx.Response(status_code, json=self.body)
+
+    async def test_post_sends_serialized_json(self):
+        """Test that POST sends JSON and parses the response."""
+        response = await self.client.post(
+            "/endpoint", headers={"Authorization": "Bearer token"},
+            data={"Amount": 10})
+
+        self.assertEqual(response, {"ResponseCode": "0"})
+        request = self.requests[0]
+        self.assertEqual(json.loads(request.content), {"Amount": 10})
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+        self.assertEqual(request.headers["Authorization"], "Bearer token")
+
+    async def test_get_raises_authentication_error(self):
+        """Test that a resultCode in a GET response is an auth error."""
+        self.body = {"resultCode": "999991", "resultDesc": "Invalid"}
+
+        with self.assertRaises(AuthenticationError):
+            await self.client.get("/token", headers={}, params={})
+
+    async def test_error_status_body_with_result_code(self):
+        """Test that a 4xx body with a resultCode maps to its exception."""
+        self.status_code = 400
+        self.body = {"resultCode": "999998", "resultDesc": "Bad grant"}
+
+        with self.assertRaises(InvalidGrantTypeError):
+            await self.client.get("/token", headers={}, params={})
+
+    async def test_http_error_status(self):
+        """Test that error status codes raise HTTPError."""
+        self.status_code = 500
+
+        with self.assertRaises(HTTPError):
+            await self.client.post("/endpoint", data={})
+
+    @patch("mpesa.utils.async_client.asyncio.sleep")
+    async def test_get_retries_unavailable_responses(self, mock_sleep):
+        """Test that GET retries 503 responses but POST does not."""
+        self.status_code = [503, 200]
+
+        response = await self.client.get("/token", headers={}, params={})
+
+        self.assertEqual(response, {"ResponseCode": "0"})
+        self.assertEqual(len(self.requests), 2)
+        mock_sleep.assert_awaited_once()
+
+        self.status_code = [503, 200]
+        with self.assertRaises(HTTPError):
+            await self.client.post("/endpoint", data={})
+        self.assertEqual(len(self.requests), 3)
+
+    @patch("mpesa.utils.async_client.backoff_delay", return_value=0)
+    async def test_transport_errors_raise_sdk_errors(self, mock_delay):
+        """Test that timeouts and connection errors become SDK errors."""
+        cases = [
+            (httpx.ReadTimeout("timed out"), TimeoutError),
+            (httpx.ConnectError("refused"), NetworkError),
+        ]
+        for error, expected in cases:
+            with self.subTest(error=type(error).__name__):
+                self.requests.clear()
+                self.client.circuit_breaker = CircuitBreaker()
+                self.error = error
+
+                with self.assertRaises(expected) as context:
+                    await self.client.get("/token", headers={}, params={})
+
+                self.assertIs(type(context.exception), expected)
+                self.assertEqual(len(self.requests), GET_RETRIES + 1)
+
+    @patch("mpesa.utils.async_client.backoff_delay", return_value=0)
+    async def test_retried_get_counts_as_one_breaker_failure(
+            self, mock_delay):
+        """Test that a GET records one breaker failure for all retries."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        self.client.circuit_breaker = breaker
+        self.error = httpx.ConnectError("refused")
+
+        with self.assertRaises(NetworkError):
+            await self.client.get("/token", headers={}, params={})
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+        with self.assertRaises(NetworkError):
+            await self.client.get("/token", headers={}, params={})
+
+        self.assertEqual(len(self.requests), 2 * (GET_RETRIES + 1))
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+    async def test_half_open_probe_error_reopens_circuit(self):
+        """Test that any exception from a half-open probe re-opens it."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        self.client.circuit_breaker = breaker
+        breaker.on_failure()
+
+        with patch.object(
+                self.client.client, "request",
+                side_effect=httpx.TooManyRedirects("loop")):
+            with self.assertRaises(TooManyRedirects):
+                await self.client.post("/endpoint", data={})
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        with patch.object(
+                self.client.client, "request",
+                side_effect=asyncio.CancelledError()):
+            with self.assertRaises(asyncio.CancelledError):
+                await self.client.post("/endpoint", data={})
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        await self.client.post("/endpoint", data={})
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    async def test_concurrent_get_token_async_fetches_once(self):
+        """Test that concurrent token requests share a single fetch."""
+        self.body = {
+            "access_token": "async_token",
+            "token_type": "Bearer",
+            "expires_in": 3600
+        }
+        auth = Auth(
+            base_url=self.client.base_url, client_key="key",
+            client_secret="secret", async_client=self.client)
+
+        async def slow_handler(request):
+            await asyncio.sleep(0.01)
+            return self._handler(request)
+        await self.client.client.aclose()
+        self.client.client = httpx.AsyncClient(
+            base_url=self.client.base_url,
+            transport=httpx.MockTransport(slow_handler))
+
+        tokens = await asyncio.gather(
+            *(auth.get_token_async() for _ in range(10)))
+        cached = await auth.get_token_async()
+
+        self.assertTrue(
+            all(t["access_token"] == "async_token" for t in tokens))
+        self.assertEqual(cached["access_token"], "async_token")
+        self.assertEqual(len(self.requests), 1)
+        self.assertIn("Basic", self.requests[0].headers["Authorization"])
+
+    async def test_concurrent_payments_share_client(self):
+        """Test that concurrent B2C payments reuse one async client."""
+        b2c = B2C(
+            base_url=self.client.base_url, access_token="token",
+            async_client=self.client)
+        payload = {
+            "InitiatorName": "testapi",
+            "SecurityCredential": "credential",
+            "CommandID": "BusinessPayment",
+            "Amount": 100,
+            "PartyA": 101010,
+            "PartyB": "251700100100",
+            "Remarks": "Payout",
+            "QueueTimeOutURL": "https://example.com/timeout",
+            "ResultURL": "https://example.com/result",
+            "Occassion": "Payout"
+        }
+
+        responses = await asyncio.gather(
+            *(b2c.make_payment_async(payload) for _ in range(5)))
+
+        self.assertEqual(len(responses), 5)
+        self.assertEqual(len(self.requests), 5)
+
+        await b2c.aclose()
+        self.assertFalse(self.client.client.is_closed)
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestDefaultAsyncClient(unittest.TestCase):
+    base_url = "https://sandbox.safaricom.et"
+
+    async def _check_shared_client(self):
+        """Check the shared client on the running loop, then close it."""
+        client = get_default_async_client(self.base_url)
+        self.assertIs(get_default_async_client(self.base_url), client)
+        self.assertIsNot(
+            get_default_async_client("https://example.com"), client)
+        await close_default_async_client("https://example.com")
+
+        await STKPush(self.base_url, "token").aclose()
+
+        self.assertTrue(client.client.is_closed)
+        self.assertIsNot(get_default_async_client(self.base_url), client)
+        await close_default_async_client(self.base_url)
+        return client
+
+    def test_default_client_is_shared_per_loop(self):
+        """Test that each event loop gets its own shared client."""
+        first = asyncio.run(self._check_shared_client())
+        second = asyncio.run(self._check_shared_client())
+
+        self.assertIsNot(first, second)
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_sdk_import_does_not_load_httpx(self):
+        """Test that importing the SDK leaves httpx unimported."""
+        code = (
+            "import sys, mpesa, mpesa.payments.b2c, mpesa.payments.c2b; "
+            "print('httpx' in sys.modules)")
+        env = {**os.environ, "ENVIRONMENT": "TEST"}
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True,
+            text=True, check=True, env=env).stdout
+
+        self.assertEqual(output.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,25 +1,45 @@
 #!/usr/bin/python3
 
+import base64
+import time
 import unittest
-from unittest.mock import patch, MagicMock
-from pydantic.v1 import ValidationError
-from mpesa.auth.auth import Auth
-from mpesa.auth.models import ConfigModel, TokenResponseModel
-from mpesa.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
+from pydantic import ValidationError
+from mpesa.auth import auth as auth_module
+from mpesa.auth.auth import Auth, get_access_token, get_default_auth
+from mpesa.auth.models import TokenResponseModel
+from mpesa.utils.client import APIClient
 from mpesa.utils.exceptions import (
-        APIError, AuthenticationError,
-        TimeoutError, NetworkError, HTTPError,
-        TooManyRedirects
+        APIError, InvalidClientIDError, InvalidAuthenticationError,
+        InvalidAuthorizationHeaderError, InvalidGrantTypeError
         )
 
+BASE_URL = "https://test-url.com"
+CLIENT_KEY = "test-client-key"
+CLIENT_SECRET = "test_client-secret"
+
 
 class TestAuth(unittest.TestCase):
-    def setUp(self):
-        """Set up test data and mocks."""
-        self.base_url = "https://test-url.com"
-        self.client_key = "test-client-key"
-        self.client_secret = "test_client-secret"
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data and the client mock."""
+        cls.base_url = BASE_URL
+        cls.client_key = CLIENT_KEY
+        cls.client_secret = CLIENT_SECRET
+
+        cls.get_patcher = patch.object(APIClient, "get")
+        cls.mock_get = cls.get_patcher.start()
 
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the client mock."""
+        cls.get_patcher.stop()
+
+    def setUp(self):
+        """Reset the client mock and create a fresh Auth instance."""
+        self.mock_get.reset_mock(return_value=True, side_effect=True)
         self.auth = Auth(
             base_url=self.base_url,
             client_key=self.client_key,
@@ -29,7 +49,7 @@ class TestAuth(unittest.TestCase):
     @patch('mpesa.auth.auth.ConfigModel')
     def test_init_valid_config(self, MockConfigModel):
         """Test that the Auth class initializes with valid configuration."""
-        MockConfigModel.return_value = ConfigModel(
+        MockConfigModel.return_value = SimpleNamespace(
             base_url=self.base_url,
             client_key=self.client_key,
             client_secret=self.client_secret
@@ -45,9 +65,13 @@ class TestAuth(unittest.TestCase):
         self.assertEqual(auth_instance.config.client_key, self.client_key)
         self.assertEqual(
                 auth_instance.config.client_secret, self.client_secret)
+        MockConfigModel.assert_called_once_with(
+            base_url=self.base_url,
+            client_key=self.client_key,
+            client_secret=self.client_secret
+        )
 
-    @patch('mpesa.auth.auth.APIClient.get')
-    def test_get_token_success(self, mock_get):
+    def test_get_token_success(self):
         """Test successful token retrieval."""
         mock_response = {
             "access_token": "test_access_token",
@@ -55,15 +79,7 @@ class TestAuth(unittest.TestCase):
             "expires_in": 3600,
             "valid_for": "1 hour"
         }
-        mock_get.return_value = mock_response
-
-        """
-        with patch(
-                'mpesa.auth.auth.TokenResponseModel'
-        ) as MockTokenResponseModel:
-            MockTokenResponseModel.return_value = TokenResponseModel(
-                **mock_response)
-        """
+        self.mock_get.return_value = mock_response
 
         token = self.auth.get_token()
 
@@ -72,155 +88,189 @@ class TestAuth(unittest.TestCase):
         self.assertEqual(token["expires_in"], 3600)
         self.assertEqual(token["valid_for"], "1 hour")
 
-    @patch('mpesa.auth.auth.APIClient.get')
-    def test_get_token_validation_error(self, mock_get):
-        """Test token response validation error handling."""
-        mock_get.return_value = {
-            "access_token": None,
+    def test_get_token_sends_basic_auth_header(self):
+        """Test that the credentials are sent as a Basic auth header."""
+        self.mock_get.return_value = {
+            "access_token": "test_access_token",
             "token_type": "Bearer",
-            "expires_in": "invalid",
-            "valid_for": "1 hour"
+            "expires_in": 3600
         }
-        with self.assertRaises(Exception):
-            with self.assertLogs(level='WARNING') as log:
-                self.auth.get_token()
+        credentials = f"{self.client_key}:{self.client_secret}"
+        expected = "Basic " + base64.b64encode(credentials.encode()).decode()
 
-                # Check if the specific warning messages occurred in the logs
-                self.assertIn(
-                    "Token response validation failed: 2 validation errors" +
-                    "for TokenResponseModel", log.output[1])
-                self.assertIn(
-                    "access_token  none is not an allowed value",
-                    log.output[2])
-                self.assertIn(
-                    "expires_in  invalid literal for int() with base " +
-                    "10: 'invalid'", log.output[3])
-
-    @patch('mpesa.auth.auth.Auth.get_token')
-    def test_get_token_api_error(self, mock_get):
-        """Test API error handling during token retrieval."""
-        mock_get.side_effect = APIError("API error occurred.")
-
-        with self.assertRaises(APIError):
-            self.auth.get_token()
+        self.auth.get_token()
 
-    @patch("mpesa.auth.auth.Auth.get_token")
-    def test_get_token_invalid_client_id(self, mock_get):
-        """Test handling of InvalidClientIDError."""
-        mock_get.side_effect = AuthenticationError(
-            "999991", "Ensure the correct client ID is used.")
+        kwargs = self.mock_get.call_args.kwargs
+        self.assertEqual(kwargs["headers"]["Authorization"], expected)
+        self.assertIs(kwargs["response_model"], TokenResponseModel)
 
-        with self.assertRaises(AuthenticationError):
-            self.auth.get_token()
+    def test_get_token_reuses_cached_token(self):
+        """Test that a valid token is served from the cache."""
+        self.mock_get.return_value = {
+            "access_token": "test_access_token",
+            "token_type": "Bearer",
+            "expires_in": 3600
+        }
 
-    @patch("mpesa.auth.auth.Auth.get_token")
-    def test_get_token_invalid_authentication(self, mock_get):
-        """Test token retrieval with an invalid authentication type."""
-        mock_get.side_effect = AuthenticationError(
-            "999996", "Ensure the authentication type is Basic Auth.")
+        first = self.auth.get_token()
+        second = self.auth.get_token()
 
-        with self.assertRaises(AuthenticationError):
-            self.auth.get_token()
+        self.mock_get.assert_called_once()
+        self.assertEqual(second["access_token"], first["access_token"])
+        self.assertLessEqual(second["expires_in"], 3600)
+
+    def test_get_token_refreshes_expiring_token(self):
+        """Test that a token close to expiry is fetched again."""
+        self.mock_get.return_value = {
+            "access_token": "test_access_token",
+            "token_type": "Bearer",
+            "expires_in": 10
+        }
 
-    @patch("mpesa.auth.auth.Auth.get_token")
-    def test_get_token_invalid_authorization_header(self, mock_get):
-        """Test token retrieval with an invalid client secret (password)."""
-        mock_get.side_effect = AuthenticationError(
-            "999996", "Ensure the correct client ID is used.")
+        self.auth.get_token()
+        self.auth.get_token()
 
-        with self.assertRaises(AuthenticationError):
-            self.auth.get_token()
+        self.assertEqual(self.mock_get.call_count, 2)
+
+    def test_invalidate_forces_refresh(self):
+        """Test that invalidate discards the cached token."""
+        self.mock_get.return_value = {
+            "access_token": "test_access_token",
+            "token_type": "Bearer",
+            "expires_in": 3600
+        }
+
+        self.auth.get_token()
+        self.auth.invalidate()
+        self.auth.get_token()
 
-    @patch("mpesa.auth.auth.Auth.get_token")
-    def test_get_token_invalid_grant_type(self, mock_get):
-        """Test token retrieval with an invalid or empty grant type."""
-        mock_get.side_effect = AuthenticationError(
-            "999998", "Use client_credentials as the grant type.")
+        self.assertEqual(self.mock_get.call_count, 2)
 
-        with self.assertRaises(AuthenticationError):
+    def test_get_access_token_uses_shared_auth(self):
+        """Test that the module-level token helper shares one cache."""
+        self.mock_get.return_value = {
+            "access_token": "shared_token",
+            "token_type": "Bearer",
+            "expires_in": 3600
+        }
+        credentials = (self.base_url, "shared-key", "shared-secret")
+        self.addCleanup(auth_module._default_auths.pop, credentials, None)
+
+        first = get_access_token(*credentials)
+        second = get_access_token(*credentials)
+
+        self.assertEqual(first, "shared_token")
+        self.assertEqual(second, "shared_token")
+        self.mock_get.assert_called_once()
+        self.assertIs(
+            get_default_auth(*credentials), get_default_auth(*credentials))
+
+    def test_concurrent_get_token_fetches_once(self):
+        """Test that threads on a cold cache share a single token fetch."""
+        def slow_get(*args, **kwargs):
+            time.sleep(0.05)
+            return {
+                "access_token": "test_access_token",
+                "token_type": "Bearer",
+                "expires_in": 3600
+            }
+        self.mock_get.side_effect = slow_get
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            tokens = list(executor.map(
+                lambda _: self.auth.get_token()["access_token"], range(10)))
+
+        self.assertEqual(tokens, ["test_access_token"] * 10)
+        self.mock_get.assert_called_once()
+
+    def test_get_token_validation_error(self):
+        """Test that an invalid token response raises ValidationError."""
+        self.mock_get.return_value = {
+            "access_token": None,
+            "token_type": "Bearer",
+            "expires_in": "invalid",
+            "valid_for": "1 hour"
+        }
+
+        with self.assertRaisesRegex(
+                ValidationError, "2 validation errors for TokenResponseModel"):
             self.auth.get_token()
 
-    @patch("mpesa.auth.auth.APIClient.get")
-    def test_unexpected_error(self, mock_get):
+    def test_get_token_errors(self):
+        """Test that API and authentication errors reach the caller."""
+        errors = [
+            APIError("API error occurred."),
+            InvalidClientIDError("Ensure the correct client ID is used."),
+            InvalidAuthenticationError(
+                "Ensure the authentication type is Basic Auth."),
+            InvalidAuthorizationHeaderError(
+                "Ensure the correct client ID is used."),
+            InvalidGrantTypeError(
+                "Use client_credentials as the grant type."),
+        ]
+        for error in errors:
+            with self.subTest(error=type(error).__name__):
+                self.mock_get.side_effect = error
+
+                with self.assertRaises(type(error)) as context:
+                    self.auth.get_token()
+
+                self.assertIs(context.exception, error)
+
+    def test_unexpected_error(self):
         """Test handling of unexpected exceptions."""
-        mock_get.side_effect = APIError("Unexpected error.")
+        self.mock_get.side_effect = APIError("Unexpected error.")
 
         with self.assertLogs("mpesa.auth.auth", level="ERROR") as cm:
             with self.assertRaises(APIError):
                 self.auth.get_token()
 
-            # self.assertIn("Unexpected error occurred", cm.output[0])
+        self.assertEqual(len(cm.records), 1)
+        self.assertIn("General API error: Unexpected error.", cm.output[0])
 
     def test_invalid_all_params(self):
         """Ensure Auth raises ValidationError and
         logs errors for invalid parameters."""
 
-        with self.assertRaises(ValidationError):
-            with self.assertLogs(level="ERROR") as log:
+        with self.assertLogs("mpesa.auth.auth", level="ERROR") as log:
+            with self.assertRaises(ValidationError):
                 Auth(base_url="", client_key="", client_secret="")
 
-            self.assertTrue(
-                    any("Configuration validation failed: 3 validation" +
-                        "errors for ConfigModel"
-                        in message for message in log.output
-                        ),
-                    "Expected error message not found in logs"
-                    )
+        self.assertIn(
+            "Configuration validation failed: 3 validation "
+            "errors for ConfigModel", log.output[0])
 
-    def test_invalid_url(self):
-        """Ensure Auth raises ValidationError and
-        logs errors for invalid parameters.
-        """
-        with self.assertRaises(ValidationError):
-            Auth(
-                    base_url="invalid_url",
-                    client_key=self.client_key,
-                    client_secret=self.client_secret
-                    )
-
-    def test_invalid_url_and_key(self):
-        """Ensure Auth raises ValidationError and
-        logs errors for invalid parameters.
-        """
-        with self.assertRaises(ValidationError):
-            Auth(
-                    base_url="invalid_url",
-                    client_key="",
-                    client_secret=self.client_secret
-                    )
-
-    def test_invalid_key_and_secret(self):
-        """Ensure Auth raises ValidationError and
-        logs errors for invalid parameters.
-        """
-        with self.assertRaises(ValidationError):
-            Auth(
+    def test_invalid_config_is_logged(self):
+        """Ensure configuration errors are logged before being re-raised."""
+        with self.assertLogs("mpesa.auth.auth", level="ERROR") as log:
+            with self.assertRaises(ValidationError):
+                Auth(
                     base_url=self.base_url,
                     client_key="",
-                    client_secret=""
+                    client_secret=self.client_secret
                     )
 
-    def test_invalid_secret(self):
-        """Ensure Auth raises ValidationError and
-        logs errors for invalid parameters.
-        """
-        with self.assertRaises(ValidationError):
-            Auth(
-                    base_url=self.base_url,
-                    client_key=self.client_key,
-                    client_secret=""
-                    )
+        self.assertIn("Configuration validation failed", log.output[0])
 
-    def test_invalid_key(self):
-        """Ensure Auth raises ValidationError and
-        logs errors for invalid parameters.
+    def test_invalid_params(self):
+        """Ensure Auth raises ValidationError for each invalid
+        combination of parameters.
         """
-        with self.assertRaises(ValidationError):
-            Auth(
-                    base_url=self.base_url,
-                    client_key="",
-                    client_secret=self.client_secret
-                    )
+        cases = {
+            "url": ("invalid_url", self.client_key, self.client_secret),
+            "url_and_key": ("invalid_url", "", self.client_secret),
+            "key_and_secret": (self.base_url, "", ""),
+            "secret": (self.base_url, self.client_key, ""),
+            "key": (self.base_url, "", self.client_secret),
+        }
+        for name, (base_url, client_key, client_secret) in cases.items():
+            with self.subTest(invalid=name):
+                with self.assertRaises(ValidationError):
+                    Auth(
+                            base_url=base_url,
+                            client_key=client_key,
+                            client_secret=client_secret
+                            )
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import MagicMock
 from mpesa.payments.b2c import B2C
+from mpesa.payments.models import B2CRequestModel
 from pydantic import ValidationError
 
 
@@ -59,6 +60,34 @@ class TestB2C(unittest.TestCase):
             data=self.valid_payload,
         )
 
+    def test_make_payment_logs_response_at_debug(self):
+        """Test that the response body is only logged at DEBUG level."""
+        self.client.post.return_value = {"ConversationID": "AG123"}
+
+        with self.assertLogs("mpesa.payments.b2c", level="INFO") as log:
+            response = self.b2c.make_payment(self.valid_payload)
+
+        self.assertEqual(response, {"ConversationID": "AG123"})
+        self.assertIn("Payment request successful.", log.output[-1])
+        self.assertFalse(any("AG123" in line for line in log.output))
+
+    def test_instances_have_no_dict(self):
+        """Test that B2C and its STKPush base only use slots."""
+        self.assertFalse(hasattr(self.b2c, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.b2c.unknown_attribute = True
+
+    def test_make_payment_with_validated_model(self):
+        """Test that a pre-validated model is sent without re-validation."""
+        model = B2CRequestModel(**self.valid_payload)
+        model.Remarks = "Retried payment"
+
+        self.b2c.make_payment(model)
+
+        self.assertEqual(
+            self.client.post.call_args.kwargs["data"],
+            {**self.valid_payload, "Remarks": "Retried payment"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,4 @@
 #!/usr/bin/python3
-from datetime import datetime
-
 import unittest
 from pydantic import ValidationError
 from mpesa.payments.models import (
@@ -4,22 +4,21 @@ from unittest.mock import patch, MagicMock
 from pydantic import ValidationError
 from mpesa.payments.c2b import C2B
 from mpesa.payments.models import RegisterURLRequest
-from mpesa.utils.exceptions import (
-    APIError, NetworkError, TimeoutError,
-    AuthenticationError, HTTPError, TooManyRedirects
-)
+from mpesa.utils.exceptions import APIError, NetworkError
 
 
 class TestC2B(unittest.TestCase):
 
-    def setUp(self):
-        """Set up a mock C2B instance and test data for use in
-        each test case.
+    @classmethod
+    def setUpClass(cls):
+        """Set up a C2B instance backed by a mock client and test data
+        shared by every test case.
         """
-        self.base_url = "https://sandbox.safaricom.et"
-        self.c2b = C2B(base_url=self.base_url)
-        self.api_key = "test_api_key"
-        self.payload = {
+        cls.base_url = "https://sandbox.safaricom.et"
+        cls.mock_client = MagicMock()
+        cls.c2b = C2B(base_url=cls.base_url, client=cls.mock_client)
+        cls.api_key = "test_api_key"
+        cls.payload = {
             "ShortCode": "123456",
             "ResponseType": "Completed",
             "CommandID": "RegisterURL",
@@ -27,8 +26,9 @@ class TestC2B(unittest.TestCase):
             "ValidationURL": "https://example.com/validation"
         }
 
-        self.mock_client = MagicMock()
-        self.c2b.client = self.mock_client
+    def setUp(self):
+        """Reset the mock client between test cases."""
+        self.mock_client.reset_mock(return_value=True, side_effect=True)
 
     @patch('mpesa.payments.c2b.C2B.register_url')
     def test_register_url_success(self, mock_register_url_request):
@@ -40,6 +40,19 @@ class TestC2B(unittest.TestCase):
         response = self.c2b.register_url(self.api_key, self.payload)
         self.assertEqual(response["ResponseDescription"], "Success")
 
+    def test_register_url_sends_api_key_query_param(self):
+        """Test that the API key is sent as an `apikey` query parameter."""
+        self.mock_client.post.return_value = {
+            "ResponseDescription": "Success"}
+
+        self.c2b.register_url(self.api_key, self.payload)
+
+        self.mock_client.post.assert_called_once_with(
+            "/v1/c2b-register-url/register",
+            params={"apikey": self.api_key},
+            data=self.payload
+        )
+
     @patch('mpesa.payments.c2b.C2B.register_url')
     def test_register_url_api_error(self, mock_register_url_request):
         """Test if APIError is raised during API failures."""
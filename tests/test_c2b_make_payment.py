@@ -5,21 +5,22 @@ from pydantic import ValidationError
 from mpesa.payments.c2b import C2B
 from mpesa.payments.models import PaymentRequest
 from mpesa.utils.exceptions import (
-    APIError, NetworkError, TimeoutError,
-    AuthenticationError, HTTPError, TooManyRedirects
+    APIError, NetworkError, HTTPError, TooManyRedirects
 )
 
 
 class TestC2BMakePayment(unittest.TestCase):
 
-    def setUp(self):
-        """Set up a mock C2B instance and test data for use in
-        each test case.
+    @classmethod
+    def setUpClass(cls):
+        """Set up a C2B instance backed by a mock client and test data
+        shared by every test case.
         """
-        self.base_url = "https://sandbox.safaricom.et"
-        self.c2b = C2B(base_url=self.base_url)
+        cls.base_url = "https://sandbox.safaricom.et"
+        cls.mock_client = MagicMock()
+        cls.c2b = C2B(base_url=cls.base_url, client=cls.mock_client)
 
-        self.payload = {
+        cls.payload = {
             "ShortCode": "123456",
             "CommandID": "CustomerPayBillOnline",
             "Amount": "500",
@@ -27,8 +28,9 @@ class TestC2BMakePayment(unittest.TestCase):
             "BillRefNumber": "INV12345"
         }
 
-        self.mock_client = MagicMock()
-        self.c2b.client = self.mock_client
+    def setUp(self):
+        """Reset the mock client between test cases."""
+        self.mock_client.reset_mock(return_value=True, side_effect=True)
 
     @patch('mpesa.payments.c2b.C2B.make_payment')
     def test_make_payment_success(self, mock_make_payment):
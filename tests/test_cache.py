@@ -0,0 +1,34 @@
+#!/usr/bin/python3
+import unittest
+from unittest.mock import patch
+from mpesa.utils.cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    @patch("mpesa.utils.cache.time.monotonic")
+    def test_entries_expire(self, mock_monotonic):
+        """Test that entries are dropped once their TTL has passed."""
+        cache = TTLCache(ttl=60)
+        mock_monotonic.return_value = 100.0
+        cache.set("key", "value")
+
+        mock_monotonic.return_value = 159.0
+        self.assertEqual(cache.get("key"), "value")
+
+        mock_monotonic.return_value = 160.0
+        self.assertIsNone(cache.get("key"))
+
+    def test_oldest_entry_is_evicted(self):
+        """Test that a full cache evicts its oldest entry."""
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+        self.assertEqual(cache.get("c"), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+import unittest
+from unittest.mock import patch
+from mpesa.utils.circuit_breaker import CircuitBreaker
+from mpesa.utils.exceptions import CircuitOpenError
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        """Set up a breaker with a low threshold."""
+        self.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+    def _trip(self):
+        """Record enough failures to open the circuit."""
+        for _ in range(self.breaker.failure_threshold):
+            self.breaker.before_call()
+            self.breaker.on_failure()
+
+    def test_opens_after_threshold(self):
+        """Test that consecutive failures open the circuit."""
+        self.breaker.on_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+        self.breaker.on_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()
+
+    def test_success_resets_failure_count(self):
+        """Test that a success between failures keeps the circuit closed."""
+        self.breaker.on_failure()
+        self.breaker.on_success()
+        self.breaker.on_failure()
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+    @patch("mpesa.utils.circuit_breaker.time.monotonic")
+    def test_half_open_probe_success_closes(self, mock_monotonic):
+        """Test that a successful probe after the cooldown closes it."""
+        mock_monotonic.return_value = 100.0
+        self._trip()
+
+        mock_monotonic.return_value = 131.0
+        self.breaker.before_call()
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()
+
+        self.breaker.on_success()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+    @patch("mpesa.utils.circuit_breaker.time.monotonic")
+    def test_half_open_probe_failure_reopens(self, mock_monotonic):
+        """Test that a failed probe opens the circuit again."""
+        mock_monotonic.return_value = 100.0
+        self._trip()
+
+        mock_monotonic.return_value = 131.0
+        self.breaker.before_call()
+        self.breaker.on_failure()
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,330 @@
+#!/usr/bin/python3
+import json
+import socket
+import unittest
+from unittest.mock import MagicMock, patch
+from pydantic import ValidationError
+from mpesa.auth.models import TokenResponseModel
+from mpesa.utils.client import (
+    APIClient, get_default_client, raise_for_error_body, GET_RETRIES,
+    POOL_MAXSIZE
+)
+from requests.exceptions import ChunkedEncodingError, ConnectionError
+from mpesa.utils.circuit_breaker import CircuitBreaker
+from mpesa.utils.exceptions import (
+        APIError, AuthenticationError, CircuitOpenError, InvalidClientIDError,
+        InvalidAuthenticationError, InvalidAuthorizationHeaderError,
+        InvalidGrantTypeError
+        )
+
+
+class TestAPIClient(unittest.TestCase):
+    def setUp(self):
+        """Set up a client for the tests."""
+        self.base_url = "https://sandbox.safaricom.et"
+        self.client = APIClient(self.base_url)
+
+    def tearDown(self):
+        """Release the client's pooled connections."""
+        self.client.close()
+
+    def test_session_uses_pooled_adapter(self):
+        """Test that HTTPS requests go through the tuned adapter."""
+        adapter = self.client.session.get_adapter(self.base_url)
+        self.assertEqual(adapter._pool_maxsize, POOL_MAXSIZE)
+        self.assertEqual(adapter.max_retries.read, 0)
+
+    def test_pooled_connections_use_tcp_keepalive(self):
+        """Test that pooled sockets enable TCP keep-alive probes."""
+        adapter = self.client.session.get_adapter(self.base_url)
+        options = adapter.poolmanager.connection_pool_kw["socket_options"]
+
+        self.assertIn(
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), options)
+
+    def test_trust_env_can_be_disabled(self):
+        """Test that environment lookups can be turned off."""
+        client = APIClient(self.base_url, trust_env=False)
+        self.addCleanup(client.close)
+
+        self.assertTrue(self.client.session.trust_env)
+        self.assertFalse(client.session.trust_env)
+
+    def test_plain_http_uses_pooled_adapter(self):
+        """Test that HTTP requests share the same tuned adapter."""
+        self.assertIs(
+            self.client.session.get_adapter("http://localhost"),
+            self.client.session.get_adapter(self.base_url))
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving the with block closes the session."""
+        with patch.object(self.client.session, "close") as mock_close:
+            with self.client as client:
+                self.assertIs(client, self.client)
+        mock_close.assert_called_once()
+
+    def test_base_url_defaults_to_config(self):
+        """Test that the base URL falls back to Config.BASE_URL."""
+        with patch("mpesa.utils.client.Config.BASE_URL", self.base_url):
+            client = APIClient()
+            self.addCleanup(client.close)
+
+            self.assertEqual(client.base_url, self.base_url)
+            self.assertIs(
+                get_default_client(), get_default_client(self.base_url))
+
+    def test_default_client_is_shared(self):
+        """Test that the default client is reused per base URL."""
+        first = get_default_client(self.base_url)
+        second = get_default_client(self.base_url)
+        other = get_default_client("https://example.com")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    def _response(self, body: bytes) -> MagicMock:
+        """Build a successful response mock with the given body."""
+        response = MagicMock(status_code=200, content=body)
+        response.raise_for_status.return_value = None
+        return response
+
+    def test_post_sends_serialized_json(self):
+        """Test that POST bodies are sent as pre-serialized JSON."""
+        payload = {"Amount": 100.5, "PartyB": "251700100100"}
+        with patch.object(
+                self.client.session, "post",
+                return_value=self._response(b'{"ResponseCode": "0"}')
+                ) as mock_post:
+            response = self.client.post(
+                "/payments", headers={"Authorization": "Bearer t"},
+                data=payload)
+
+        self.assertEqual(response, {"ResponseCode": "0"})
+        kwargs = mock_post.call_args.kwargs
+        self.assertEqual(json.loads(kwargs["data"]), payload)
+        self.assertEqual(
+            kwargs["headers"]["Content-Type"], "application/json")
+        self.assertEqual(kwargs["headers"]["Authorization"], "Bearer t")
+        self.assertEqual(
+            mock_post.call_args.args[0], f"{self.base_url}/payments")
+
+    def test_url_is_memoized_per_endpoint(self):
+        """Test that the full URL is built once per endpoint."""
+        first = self.client._get_url("/token")
+
+        self.assertEqual(first, f"{self.base_url}/token")
+        self.assertIs(self.client._get_url("/token"), first)
+
+    def test_get_parses_response_content(self):
+        """Test that GET responses are decoded from the raw body."""
+        with patch.object(
+                self.client.session, "get",
+                return_value=self._response(b'{"access_token": "abc"}')):
+            response = self.client.get("/token", headers={}, params={})
+
+        self.assertEqual(response, {"access_token": "abc"})
+
+    def test_get_validates_into_response_model(self):
+        """Test that GET bodies can be validated straight into a model."""
+        body = (b'{"access_token": "abc", "token_type": "Bearer", '
+                b'"expires_in": "3600"}')
+        with patch.object(
+                self.client.session, "get",
+                return_value=self._response(body)):
+            response = self.client.get(
+                "/token", headers={}, params={},
+                response_model=TokenResponseModel)
+
+        self.assertIsInstance(response, TokenResponseModel)
+        self.assertEqual(response.access_token, "abc")
+        self.assertEqual(response.expires_in, 3600)
+
+    def test_response_model_errors(self):
+        """Test that resultCode bodies still raise their own exception."""
+        rejected = b'{"resultCode": "999991", "resultDesc": "Invalid"}'
+        for body, error in ((rejected, InvalidClientIDError),
+                            (b'{"token_type": "Bearer"}', ValidationError),
+                            (b"<html>", APIError)):
+            with self.subTest(body=body):
+                with patch.object(
+                        self.client.session, "get",
+                        return_value=self._response(body)):
+                    with self.assertRaises(error):
+                        self.client.get(
+                            "/token", headers={}, params={},
+                            response_model=TokenResponseModel)
+
+    def test_post_invalid_json_raises_api_error(self):
+        """Test that an undecodable body raises APIError."""
+        with patch.object(
+                self.client.session, "post",
+                return_value=self._response(b"<html>")):
+            with self.assertRaises(APIError):
+                self.client.post("/endpoint", data={})
+
+    @patch("mpesa.utils.client.time.sleep")
+    def test_get_retries_transient_failures(self, mock_sleep):
+        """Test that GET retries connection errors and 503 responses."""
+        unavailable = self._response(b"{}")
+        unavailable.status_code = 503
+        responses = [
+            ConnectionError("reset"), unavailable,
+            self._response(b'{"access_token": "abc"}')]
+        with patch.object(
+                self.client.session, "get",
+                side_effect=responses) as mock_get:
+            response = self.client.get("/token", headers={}, params={})
+
+        self.assertEqual(response, {"access_token": "abc"})
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch("mpesa.utils.client.time.sleep")
+    def test_client_errors_and_posts_are_not_retried(self, mock_sleep):
+        """Test that 4xx responses and POST failures are not retried."""
+        not_found = self._response(b"{}")
+        not_found.status_code = 404
+        with patch.object(
+                self.client.session, "get",
+                return_value=not_found) as mock_get:
+            self.client.get("/token", headers={}, params={})
+        with patch.object(
+                self.client.session, "post",
+                side_effect=ConnectionError("reset")) as mock_post:
+            with self.assertRaises(ConnectionError):
+                self.client.post("/endpoint", data={})
+
+        mock_get.assert_called_once()
+        mock_post.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_get_caches_responses_when_enabled(self):
+        """Test that GET responses are cached per headers and params."""
+        client = APIClient(self.base_url, cache_ttl=60)
+        self.addCleanup(client.close)
+        with patch.object(
+                client.session, "get",
+                return_value=self._response(b'{"value": 1}')) as mock_get:
+            first = client.get("/status", headers={"a": "1"}, params={})
+            second = client.get("/status", headers={"a": "1"}, params={})
+            client.get("/status", headers={"a": "2"}, params={})
+
+        self.assertEqual(first, {"value": 1})
+        self.assertEqual(second, first)
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_get_does_not_cache_by_default(self):
+        """Test that caching is disabled unless cache_ttl is set."""
+        with patch.object(
+                self.client.session, "get",
+                return_value=self._response(b'{"value": 1}')) as mock_get:
+            self.client.get("/status", headers={}, params={})
+            self.client.get("/status", headers={}, params={})
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("mpesa.utils.client.time.sleep")
+    def test_retried_get_counts_as_one_breaker_failure(self, mock_sleep):
+        """Test that a GET records one breaker failure for all retries."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        self.client.circuit_breaker = breaker
+        with patch.object(
+                self.client.session, "get",
+                side_effect=ConnectionError("down")) as mock_get:
+            with self.assertRaises(ConnectionError):
+                self.client.get("/token", headers={}, params={})
+            self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+            with self.assertRaises(ConnectionError):
+                self.client.get("/token", headers={}, params={})
+
+        self.assertEqual(mock_get.call_count, 2 * (GET_RETRIES + 1))
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+    def test_open_circuit_fails_fast(self):
+        """Test that requests are not sent once the circuit opens."""
+        self.client.circuit_breaker = CircuitBreaker(failure_threshold=2)
+        with patch.object(
+                self.client.session, "post",
+                side_effect=ConnectionError("down")) as mock_post:
+            for _ in range(2):
+                with self.assertRaises(ConnectionError):
+                    self.client.post("/endpoint", data={})
+            with self.assertRaises(CircuitOpenError):
+                self.client.post("/endpoint", data={})
+
+        self.assertEqual(mock_post.call_count, 2)
+
+    def test_half_open_probe_error_reopens_circuit(self):
+        """Test that any exception from a half-open probe re-opens it."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        self.client.circuit_breaker = breaker
+        with patch.object(
+                self.client.session, "post",
+                side_effect=ConnectionError("down")):
+            with self.assertRaises(ConnectionError):
+                self.client.post("/endpoint", data={})
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        with patch.object(
+                self.client.session, "post",
+                side_effect=ChunkedEncodingError("broken")):
+            with self.assertRaises(ChunkedEncodingError):
+                self.client.post("/endpoint", data={})
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        with patch.object(
+                self.client.session, "post",
+                return_value=self._response(b"{}")) as mock_post:
+            self.assertEqual(self.client.post("/endpoint", data={}), {})
+        mock_post.assert_called_once()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_error_status_body_with_result_code(self):
+        """Test that a 4xx body with a resultCode maps to its exception."""
+        rejected = self._response(
+            b'{"resultCode": "999991", "resultDesc": "Invalid client id"}')
+        rejected.status_code = 400
+        with patch.object(
+                self.client.session, "get", return_value=rejected):
+            with self.assertRaises(InvalidClientIDError):
+                self.client.get("/token", headers={}, params={})
+
+        rejected.raise_for_status.assert_not_called()
+
+    def test_raise_for_error_body_ignores_other_bodies(self):
+        """Test that error bodies without a resultCode raise nothing."""
+        for content in (b"<html>", b"[]", b'{"errorCode": "404.001.03"}'):
+            with self.subTest(content=content):
+                self.assertIsNone(raise_for_error_body(content))
+
+        with self.assertRaises(InvalidGrantTypeError):
+            raise_for_error_body(b'{"resultCode": "999998"}')
+
+    def test_get_maps_result_codes_to_exceptions(self):
+        """Test that each resultCode raises its specific exception."""
+        cases = {
+            "999991": InvalidClientIDError,
+            "999996": InvalidAuthenticationError,
+            "999997": InvalidAuthorizationHeaderError,
+            "999998": InvalidGrantTypeError,
+            "123456": AuthenticationError,
+        }
+        for result_code, error in cases.items():
+            with self.subTest(result_code=result_code):
+                body = json.dumps({
+                    "resultCode": result_code, "resultDesc": "Failed"})
+                with patch.object(
+                        self.client.session, "get",
+                        return_value=self._response(body.encode())):
+                    with self.assertRaises(error) as context:
+                        self.client.get("/token", headers={}, params={})
+
+                self.assertIs(type(context.exception), error)
+                self.assertIn(result_code, str(context.exception))
+                self.assertIn(
+                    "Description: Failed", str(context.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+#!/usr/bin/python3
+import os
+import unittest
+from unittest.mock import patch
+from mpesa.config import Config
+
+
+class TestConfig(unittest.TestCase):
+    @patch("mpesa.config.load_dotenv")
+    def test_env_file_parsed_once(self, mock_load_dotenv):
+        """Test that repeated loads do not re-parse the same .env file."""
+        self.addCleanup(Config._loaded_env_files.discard, "test.env")
+
+        Config.load_config("test.env")
+        Config.load_config("test.env")
+
+        mock_load_dotenv.assert_called_once_with("test.env")
+
+    @patch("mpesa.config.load_dotenv")
+    def test_timeout_parsed_as_float(self, mock_load_dotenv):
+        """Test that TIMEOUT is converted to a number when loaded."""
+        self.addCleanup(Config.load_config)
+
+        with patch.dict(os.environ, {"TIMEOUT": "2.5"}):
+            Config.load_config()
+        self.assertEqual(Config.TIMEOUT, 2.5)
+
+        with patch.dict(os.environ, {"TIMEOUT": ""}):
+            Config.load_config()
+        self.assertEqual(Config.TIMEOUT, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
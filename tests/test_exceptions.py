@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+import copy
+import pickle
+import unittest
+from mpesa.utils.exceptions import (
+        APIError, AuthenticationError, AUTHENTICATION_ERRORS,
+        CircuitOpenError, HTTPError, InvalidClientIDError, NetworkError,
+        TimeoutError, TooManyRedirects, authentication_error
+        )
+
+
+class TestAuthenticationErrorDispatch(unittest.TestCase):
+    def test_known_result_codes(self):
+        """Test that each known result code builds its own exception."""
+        for result_code, error in AUTHENTICATION_ERRORS.items():
+            with self.subTest(result_code=result_code):
+                exception = authentication_error(result_code, "Failed")
+
+                self.assertIs(type(exception), error)
+                self.assertIsInstance(exception, AuthenticationError)
+                self.assertEqual(exception.mitigation, error.mitigation)
+                self.assertNotEqual(
+                    exception.mitigation, AuthenticationError.mitigation)
+
+    def test_unknown_result_code(self):
+        """Test that unknown result codes fall back to the base class."""
+        exception = authentication_error("500.001.1001", "Server busy")
+
+        self.assertIs(type(exception), AuthenticationError)
+        self.assertEqual(
+            exception.mitigation, AuthenticationError.mitigation)
+        self.assertIn("500.001.1001", str(exception))
+        self.assertIn("Server busy", str(exception))
+
+
+class TestExceptionPickling(unittest.TestCase):
+    def test_pickle_round_trip(self):
+        """Test that SDK exceptions keep their state through pickle."""
+        errors = [
+            APIError("boom", "do X"),
+            NetworkError("offline"),
+            TimeoutError(),
+            HTTPError("bad status", "check the request"),
+            TooManyRedirects(),
+            CircuitOpenError(5),
+            AuthenticationError("123456", "Failed"),
+            InvalidClientIDError("Wrong client"),
+        ]
+        for error in errors:
+            with self.subTest(error=type(error).__name__):
+                restored = pickle.loads(pickle.dumps(error))
+
+                self.assertIs(type(restored), type(error))
+                self.assertEqual(restored.args, error.args)
+                self.assertEqual(restored.mitigation, error.mitigation)
+                self.assertEqual(str(restored), str(error))
+                self.assertEqual(
+                    copy.copy(error).mitigation, error.mitigation)
+
+        self.assertEqual(
+            pickle.loads(pickle.dumps(CircuitOpenError(5))).retry_after, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,73 +3,129 @@
 import os
 import unittest
 import logging
-import tempfile
 from unittest.mock import patch
+from logging.handlers import QueueHandler, RotatingFileHandler
+from mpesa.config import Config
+from mpesa.utils import logger as logger_module
 from mpesa.utils.logger import get_logger
+from tests import LOG_DIR
 
 
 def reset_logger(name: str):
     """
-    Resets the logger by removing and closing all handlers.
+    Resets the logger by removing all handlers.
+
+    The file handlers shared through the logger module are left open, so
+    tests writing to the same file reuse one handler instead of opening
+    the file again; any other handler is closed.
     """
     logger = logging.getLogger(name)
+    shared = set(logger_module._file_handlers.values())
     while logger.handlers:
         handler = logger.handlers[0]
-        handler.close()
         logger.removeHandler(handler)
+        if handler not in shared:
+            handler.close()
     return logger
 
 
 class TestLogger(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Sets up a temporary directory for logs and patches log_file_path.
+        Sets up a log file in the suite's temporary log directory, which
+        is removed in one go when the test run exits.
         """
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.log_file_path = os.path.join(self.temp_dir.name, "mpesa.log")
+        cls.log_file_path = os.path.join(LOG_DIR, "test_logger.log")
 
-        # Patch log_file_path globally in the logger module
-        self.patcher = patch(
-               "mpesa.utils.logger.log_file_path", self.log_file_path)
-        self.patcher.start()
+        # Keep test records out of the root logger's handlers
+        logging.getLogger("test_logger").propagate = False
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Restores propagation.
+        """
+        logging.getLogger("test_logger").propagate = True
 
-        # Reset the logger before each test
+    def setUp(self):
+        """
+        Points log_file_path at the temporary file and resets the logger.
+        """
+        self.override(logger_module, "log_file_path", self.log_file_path)
         reset_logger("test_logger")
 
-    def tearDown(self):
+    def override(self, obj, name: str, value):
         """
-        Cleans up the temporary directory and stops patches.
+        Sets an attribute for the duration of the test.
+
+        A plain setattr restored by a cleanup is much cheaper than
+        building a patcher and mock for a simple value swap.
         """
-        self.temp_dir.cleanup()
-        self.patcher.stop()
+        self.addCleanup(setattr, obj, name, getattr(obj, name))
+        setattr(obj, name, value)
 
-    @patch("mpesa.utils.logger.Config.ENVIRONMENT", "DEV")
     def test_logger_configuration(self):
         """
         Tests that the logger is configured with the correct handlers.
         """
+        self.override(Config, "ENVIRONMENT", "DEV")
         logger = get_logger("test_logger")
-        logger.propagate = False  # Suppress log output
 
-        self.assertEqual(len(logger.handlers), 2)
+        self.assertEqual(
+            sorted(type(h).__name__ for h in logger.handlers),
+            ["RotatingFileHandler", "StreamHandler"])
+        file_handler = next(
+            h for h in logger.handlers if isinstance(h, RotatingFileHandler))
+        self.assertEqual(file_handler.baseFilename, self.log_file_path)
+
+    def test_repeated_calls_do_not_duplicate_handlers(self):
+        """
+        Tests that getting the same logger twice reuses its handlers.
+        """
+        self.override(Config, "ENVIRONMENT", "DEV")
+        logger = get_logger("test_logger")
+        handlers = list(logger.handlers)
 
-        file_handler = next(h for h in logger.handlers if isinstance(
-               h, logging.handlers.RotatingFileHandler))
-        stream_handler = next(h for h in logger.handlers if isinstance(
-               h, logging.StreamHandler))
+        self.assertIs(get_logger("test_logger"), logger)
+        self.assertEqual(logger.handlers, handlers)
 
-        self.assertIsNotNone(file_handler)
-        self.assertIsNotNone(stream_handler)
-        self.assertEqual(file_handler.baseFilename, self.log_file_path)
+    def test_loggers_share_file_handler(self):
+        """
+        Tests that loggers writing to the same file share one handler.
+        """
+        self.override(Config, "ENVIRONMENT", "TEST")
+        self.addCleanup(reset_logger, "other_test_logger")
+        logger = get_logger("test_logger")
+        other = get_logger("other_test_logger")
+
+        self.assertEqual(len(logger.handlers), 1)
+        self.assertIs(logger.handlers[0], other.handlers[0])
+
+    def test_queue_logging(self):
+        """
+        Tests that LOG_QUEUE routes records through a background listener.
+        """
+        self.override(Config, "ENVIRONMENT", "TEST")
+        self.override(Config, "LOG_QUEUE", True)
+        logger = get_logger("test_logger")
+
+        self.assertEqual(len(logger.handlers), 1)
+        self.assertIsInstance(logger.handlers[0], QueueHandler)
+
+        logger.info("Testing queued logging")
+        logger.handlers[0].queue.join()
+
+        with open(self.log_file_path, "r") as log_file:
+            self.assertIn("Testing queued logging", log_file.read())
 
     @patch.dict(os.environ, {"LOG_LEVEL": "ERROR"})
-    @patch("mpesa.utils.logger.Config.ENVIRONMENT", "TEST")
     def test_log_file_creation(self):
         """
         Ensures logger creates and writes to a log file.
         """
+        self.override(Config, "ENVIRONMENT", "TEST")
         logger = get_logger("test_logger")
-        logger.propagate = False
 
         logger.info("Testing log file creation")
         self.assertTrue(os.path.exists(self.log_file_path))
@@ -78,37 +134,35 @@ class TestLogger(unittest.TestCase):
             content = log_file.read()
         self.assertIn("Testing log file creation", content)
 
-    @patch("mpesa.utils.logger.Config.LOG_LEVEL", "DEBUG")
-    def test_dynamic_log_level(self):
+    def test_log_level(self):
         """
-        Confirms logger respects the dynamic log level
-        set in the configuration.
+        Confirms logger respects the log level set in the configuration,
+        defaulting to DEBUG when it is missing or invalid.
         """
-        logger = get_logger("test_logger")
-        logger.propagate = False
-        self.assertEqual(logger.level, logging.DEBUG)
+        cases = {
+            "DEBUG": logging.DEBUG,
+            "ERROR": logging.ERROR,
+            None: logging.DEBUG,
+            "INVALID": logging.DEBUG,
+        }
+        for log_level, expected in cases.items():
+            with self.subTest(log_level=log_level):
+                reset_logger("test_logger")
+                self.override(Config, "LOG_LEVEL", log_level)
+                logger = get_logger("test_logger")
+                self.assertEqual(logger.level, expected)
 
     @patch("mpesa.utils.logger.RotatingFileHandler.emit")
-    @patch("mpesa.utils.logger.Config.ENVIRONMENT", "TEST")
     def test_rotating_file_handler_emits(self, mock_emit):
         """
         Tests that the RotatingFileHandler's emit method is called.
         """
+        self.override(Config, "ENVIRONMENT", "TEST")
         logger = get_logger("test_logger")
-        logger.propagate = False
 
         logger.info("Testing RotatingFileHandler")
         mock_emit.assert_called()
 
-    @patch("mpesa.utils.logger.Config.LOG_LEVEL", "INVALID")
-    def test_invalid_log_level_defaults_to_info(self):
-        """
-        Ensures invalid log levels default to DEBUG.
-        """
-        logger = get_logger("test_logger")
-        logger.propagate = False
-        self.assertEqual(logger.level, logging.DEBUG)
-
 
 if __name__ == "__main__":
     unittest.main()
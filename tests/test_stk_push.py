@@ -1,21 +1,24 @@
 #!/usr/bin/python3
+import copy
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from mpesa.payments.stk_push import STKPush
 from mpesa.utils.client import APIClient
-from mpesa.payments.models import STKPushPayload, TransactionReferenceItem
+from mpesa.payments.models import STKPushPayload
 from pydantic import ValidationError
 
 
 class TestSTKPush(unittest.TestCase):
     """Unit tests for the STKPush class."""
-    def setUp(self):
-        self.base_url = "https://sandbox.safaricom.co.ke"
-        self.access_token = "test_access_token"
-        self.short_code = "123456"
-        self.pass_key = "test_pass_key"
-        self.stk_push = STKPush(self.base_url, self.access_token)
-        self.payload = {
+    @classmethod
+    def setUpClass(cls):
+        """Build the STKPush instance and payload template once."""
+        cls.base_url = "https://sandbox.safaricom.co.ke"
+        cls.access_token = "test_access_token"
+        cls.short_code = "123456"
+        cls.pass_key = "test_pass_key"
+        cls.stk_push = STKPush(cls.base_url, cls.access_token)
+        cls._payload_template = {
             "MerchantRequestID": "12345",
             "BusinessShortCode": "123456",
             "Password": "encoded_password",
@@ -33,6 +36,10 @@ class TestSTKPush(unittest.TestCase):
             ]
         }
 
+    def setUp(self):
+        """Give each test its own copy of the payload to modify."""
+        self.payload = copy.deepcopy(self._payload_template)
+
     @patch.object(APIClient, 'post')
     def test_send_stk_push_successful(self, mock_post):
         """Test successful STK push request."""
@@ -55,6 +62,52 @@ class TestSTKPush(unittest.TestCase):
         self.assertEqual(response["CustomerMessage"], msg)
         mock_post.assert_called_once()
 
+    @patch.object(APIClient, 'post')
+    def test_send_stk_push_with_validated_model(self, mock_post):
+        """Test that a pre-validated payload model is accepted."""
+        model = STKPushPayload(**self.payload)
+
+        self.stk_push.send_stk_push(model)
+
+        self.assertEqual(
+            mock_post.call_args.kwargs["data"], model.model_dump())
+
+    def test_headers_are_case_insensitive(self):
+        """Test that the prebuilt headers can be looked up by any case."""
+        self.assertEqual(
+            self.stk_push.headers["authorization"],
+            f"Bearer {self.access_token}")
+        self.assertEqual(
+            self.stk_push.headers["CONTENT-TYPE"], "application/json")
+
+    @patch.object(APIClient, 'post')
+    def test_send_stk_push_with_token_provider(self, mock_post):
+        """Test that a callable access token is resolved per request."""
+        tokens = iter(["first_token", "second_token"])
+        stk_push = STKPush(self.base_url, lambda: next(tokens))
+
+        stk_push.send_stk_push(self.payload)
+        stk_push.send_stk_push(self.payload)
+
+        authorizations = [
+            call.kwargs["headers"]["Authorization"]
+            for call in mock_post.call_args_list]
+        self.assertEqual(
+            authorizations, ["Bearer first_token", "Bearer second_token"])
+
+    @patch.object(APIClient, 'post')
+    def test_token_provider_headers_are_reused(self, mock_post):
+        """Test that headers are rebuilt only when the token changes."""
+        tokens = iter(["first_token", "first_token", "second_token"])
+        stk_push = STKPush(self.base_url, lambda: next(tokens))
+
+        for _ in range(3):
+            stk_push.send_stk_push(self.payload)
+
+        sent = [call.kwargs["headers"] for call in mock_post.call_args_list]
+        self.assertIs(sent[0], sent[1])
+        self.assertEqual(sent[2]["Authorization"], "Bearer second_token")
+
     def test_send_stk_push_validation_error(self):
         """Test STK push with invalid payload."""
         invalid_payload = self.payload
@@ -63,6 +116,32 @@ class TestSTKPush(unittest.TestCase):
         with self.assertRaises(ValidationError):
             self.stk_push.send_stk_push(invalid_payload)
 
+    @patch.object(APIClient, 'post')
+    def test_send_stk_push_validation_error_skips_request(self, mock_post):
+        """Test that an invalid payload is never sent to the API."""
+        del self.payload['PhoneNumber']
+
+        with self.assertRaises(ValidationError):
+            self.stk_push.send_stk_push(self.payload)
+
+        mock_post.assert_not_called()
+
+    def test_send_stk_push_invalid_transaction_type(self):
+        """Test STK push with an unsupported transaction type."""
+        self.payload['TransactionType'] = 'CustomerPayBill'
+
+        with self.assertRaises(ValidationError):
+            self.stk_push.send_stk_push(self.payload)
+
+    def test_send_stk_push_out_of_range_values(self):
+        """Test STK push with a non-positive amount or invalid PartyB."""
+        for field, value in (("Amount", 0), ("PartyB", 9999),
+                             ("PartyB", 1000000)):
+            with self.subTest(field=field, value=value):
+                payload = {**self.payload, field: value}
+                with self.assertRaises(ValidationError):
+                    self.stk_push.send_stk_push(payload)
+
     @patch.object(APIClient, 'post')
     def test_send_stk_push_api_error(self, mock_post):
         """Test API error handling in STK push request."""